@@ -26,6 +26,7 @@ import tempfile
 import warnings
 from pathlib import Path
 from dataclasses import replace, dataclass
+from typing import Optional
 import math
 
 import numpy as np
@@ -200,7 +201,8 @@ def pack_packables(packables, plate_size, padding):
     return packables
 
 
-def parse_args():
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments (sys.argv[1:] when argv is None)."""
     parser = argparse.ArgumentParser(
         description="Generate build plate for tuners (FDM or Resin)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -266,11 +268,11 @@ Examples:
         action="store_true",
         help="Visualize the build plate",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main():
-    args = parse_args()
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
 
     # Determine plate size and padding
     plate_key = args.plate_size or args.process
@@ -8,6 +8,7 @@ from .gang_assembly import (
     position_tuner_at_housing,
     run_interference_report,
     check_interference,
+    check_interference_pairs,
     COLOR_MAP,
 )
 from .post_wheel_assembly import create_post_wheel_assembly, create_post_wheel_compound
@@ -20,6 +21,7 @@ __all__ = [
     "position_tuner_at_housing",
     "run_interference_report",
     "check_interference",
+    "check_interference_pairs",
     "COLOR_MAP",
     "create_post_wheel_assembly",
     "create_post_wheel_compound",
@@ -7,6 +7,7 @@ This module provides:
 - position_tuner_at_housing(): Position a single tuner at a housing center
 - create_positioned_assembly(): Create complete assembly with all parts positioned
 - check_interference(): Utility for interference checking between parts
+- check_interference_pairs(): check_interference() over many pairs
 """
 
 from pathlib import Path
@@ -53,6 +54,22 @@ def check_interference(part_a: Part, part_b: Part) -> float:
         return 0.0
 
 
+def check_interference_pairs(pairs: list[tuple[Part, Part]]) -> list[float]:
+    """Return check_interference() for each pair.
+
+    The pairs are intersected serially in this process. build123d runs
+    booleans on OCCT's thread pool, whose threads do not survive fork(), so
+    a forked worker's boolean would wait on them forever.
+
+    Args:
+        pairs: (part_a, part_b) pairs to intersect
+
+    Returns:
+        Intersection volumes in mm³, in the same order as pairs
+    """
+    return [check_interference(part_a, part_b) for part_a, part_b in pairs]
+
+
 def position_tuner_at_housing(
     tuner_components: dict[str, Part],
     housing_y: float,
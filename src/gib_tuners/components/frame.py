@@ -22,6 +22,7 @@ from build123d import (
     Align,
     Axis,
     Box,
+    Compound,
     Cylinder,
     Location,
     Part,
@@ -35,7 +36,7 @@ from ..config.defaults import calculate_worm_z
 from ..utils.validation import check_shape_quality
 
 
-def _create_engraving(config: BuildConfig) -> Optional[Part]:
+def _create_engraving(config: BuildConfig) -> Optional[Compound]:
     """Create decorative border engraving geometry to subtract from frame top.
 
     Pattern: two rectangular border grooves (outer and inner) with diagonal
@@ -130,12 +131,9 @@ def _create_engraving(config: BuildConfig) -> Optional[Part]:
         diagonal(-xp, band_cy_bottom, -45)
         diagonal(-xp, band_cy_top, -45)
 
-    # Fuse all cuts into one solid for a single boolean subtraction
-    result = cuts[0]
-    for c in cuts[1:]:
-        result = result + c
-
-    return result
+    # Return the cutters as one compound for a single boolean subtraction.
+    # (Fusing them first cost a boolean per line against an ever-growing solid.)
+    return Compound(cuts)
 
 
 def create_frame(config: BuildConfig, label: bool = True) -> Part:
@@ -190,9 +188,12 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
     first_housing_start = housing_centers[0] - housing_length / 2
     last_housing_end = housing_centers[-1] + housing_length / 2
 
+    # Gap, mounting and sandwich cutters are collected and subtracted in one
+    # boolean (one OCCT cut with many tools is far cheaper than many cuts)
+    cutters: list[Part] = []
+
     def mill_gap(y_start: float, y_end: float) -> None:
         """Remove all material below mounting plate in a gap region."""
-        nonlocal frame
         gap_length = y_end - y_start
         if gap_length <= 0:
             return
@@ -201,8 +202,7 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
             box_outer + 0.2, gap_length, box_outer - wall + 0.1,
             align=(Align.CENTER, Align.MIN, Align.MAX),
         )
-        cut = cut.locate(Location((0, y_start, -wall)))
-        frame = frame - cut
+        cutters.append(cut.locate(Location((0, y_start, -wall))))
 
     # Before first housing
     if first_housing_start > 0:
@@ -230,8 +230,7 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
         )
         # Drill from just above Z=0 down through mounting plate
         hole = hole.rotate(Axis.X, 180)  # Point downward
-        hole = hole.locate(Location((0, y_pos, 0.1)))
-        frame = frame - hole
+        cutters.append(hole.locate(Location((0, y_pos, 0.1))))
 
     # Drill sandwich pattern for each housing
     # Worm and wheel axes are offset from housing center by center_distance/2
@@ -246,6 +245,14 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
     post_y_offset = -effective_cd / 2  # Post toward -Y (nut/bridge end)
     worm_y_offset = effective_cd / 2   # Worm toward +Y
 
+    # Hole sizes and worm height are the same for every housing
+    post_hole_d = config.with_tolerance(frame_params.post_bearing_hole) * scale
+    wheel_hole_d = config.with_tolerance(frame_params.wheel_inlet_hole) * scale
+    # Entry is larger (worm OD + clearance), bearing smaller (peg shaft + clearance)
+    worm_entry_d = config.with_tolerance(frame_params.worm_entry_hole) * scale
+    peg_bearing_d = config.with_tolerance(frame_params.peg_bearing_hole) * scale
+    worm_z = calculate_worm_z(config)  # Position based on gear configuration
+
     for housing_y in housing_centers:
         # Calculate actual Y positions for this housing
         post_y = housing_y + post_y_offset
@@ -253,35 +260,24 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
 
         # Post bearing hole (top/mounting plate) - Z axis, from top
         # Posts emerge upward through this hole
-        post_hole_d = config.with_tolerance(frame_params.post_bearing_hole) * scale
         post_hole = Cylinder(
             radius=post_hole_d / 2,
             height=wall + 0.2,
             align=(Align.CENTER, Align.CENTER, Align.MIN),
         )
         post_hole = post_hole.rotate(Axis.X, 180)  # Point downward
-        post_hole = post_hole.locate(Location((0, post_y, 0.1)))
-        frame = frame - post_hole
+        cutters.append(post_hole.locate(Location((0, post_y, 0.1))))
 
         # Wheel inlet hole (bottom) - Z axis, from bottom
-        wheel_hole_d = config.with_tolerance(frame_params.wheel_inlet_hole) * scale
         wheel_hole = Cylinder(
             radius=wheel_hole_d / 2,
             height=wall + 0.2,
             align=(Align.CENTER, Align.CENTER, Align.MIN),
         )
         # Start below bottom surface (-box_outer - 0.1) and drill upward through wall
-        wheel_hole = wheel_hole.locate(Location((0, post_y, -box_outer - 0.1)))
-        frame = frame - wheel_hole
+        cutters.append(wheel_hole.locate(Location((0, post_y, -box_outer - 0.1))))
 
         # Worm entry and bearing holes (sides) - X axis
-        # Entry is larger (worm OD + clearance)
-        # Bearing is smaller (peg shaft + clearance)
-        worm_entry_d = config.with_tolerance(frame_params.worm_entry_hole) * scale
-        peg_bearing_d = config.with_tolerance(frame_params.peg_bearing_hole) * scale
-
-        worm_z = calculate_worm_z(config)  # Position based on gear configuration
-
         # Determine side based on hand
         if config.hand == Hand.RIGHT:
             # RH: Entry on RIGHT (+X), bearing on LEFT (-X)
@@ -299,8 +295,7 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
             align=(Align.CENTER, Align.CENTER, Align.MIN),
         )
         entry_hole = entry_hole.rotate(Axis.Y, 90)
-        entry_hole = entry_hole.locate(Location((entry_x, worm_y, worm_z)))
-        frame = frame - entry_hole
+        cutters.append(entry_hole.locate(Location((entry_x, worm_y, worm_z))))
 
         # Bearing hole (smaller, for peg shaft)
         bearing_hole = Cylinder(
@@ -309,8 +304,9 @@ def create_frame(config: BuildConfig, label: bool = True) -> Part:
             align=(Align.CENTER, Align.CENTER, Align.MIN),
         )
         bearing_hole = bearing_hole.rotate(Axis.Y, 90)
-        bearing_hole = bearing_hole.locate(Location((bearing_x, worm_y, worm_z)))
-        frame = frame - bearing_hole
+        cutters.append(bearing_hole.locate(Location((bearing_x, worm_y, worm_z))))
+
+    frame = frame - cutters
 
     # Etch "L" or "R" on inside surface of mounting plate to identify hand
     # Visible when looking from below (into the mechanism cavity)
@@ -27,10 +27,10 @@ from build123d import (
     Cylinder,
     Location,
     Part,
-    import_step,
 )
 
 from ..config.parameters import BuildConfig
+from ..utils.step_import import import_step_cached
 from ..utils.validation import check_shape_quality
 
 
@@ -149,7 +149,7 @@ def create_peg_head(
     worm_len = worm_length if worm_length is not None else params.worm_length
 
     # Import peg head and cut at Z=0 (keep Z ≤ 0)
-    peg_head_imported = import_step(PEG_HEAD_STEP)
+    peg_head_imported = import_step_cached(PEG_HEAD_STEP)
     # import_step returns ShapeList; fuse into single Part if multiple shapes
     if hasattr(peg_head_imported, '__iter__') and not isinstance(peg_head_imported, Part):
         peg_head_full = peg_head_imported[0]
@@ -174,7 +174,7 @@ def create_peg_head(
     # Add worm if requested and STEP exists
     if include_worm and worm_step.exists():
         # Import worm
-        worm_imported = import_step(worm_step)
+        worm_imported = import_step_cached(worm_step)
         if hasattr(worm_imported, '__iter__') and not isinstance(worm_imported, (Part, Compound)):
             worm = _to_part(worm_imported[0])
         else:
@@ -17,11 +17,11 @@ from build123d import (
     Cylinder,
     Location,
     Part,
-    import_step,
 )
 
 from ..config.parameters import BuildConfig
 from ..features.dd_cut import create_dd_cut_bore
+from ..utils.step_import import import_step_cached
 from ..utils.validation import check_shape_quality
 
 
@@ -40,7 +40,8 @@ def load_wheel(step_path: Path) -> Part:
     if not step_path.exists():
         raise FileNotFoundError(f"Wheel STEP file not found: {step_path}")
 
-    shapes = import_step(step_path)
+    # Parsed once per file; later loads get a copy of the cached shape
+    shapes = import_step_cached(step_path)
 
     # import_step can return various types depending on STEP content
     if isinstance(shapes, Part):
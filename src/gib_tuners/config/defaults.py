@@ -2,7 +2,10 @@
 
 import json
 import math
-from dataclasses import dataclass
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -14,7 +17,6 @@ from .parameters import (
     Hand,
     PegHeadParams,
     StringPostParams,
-    ToleranceConfig,
     WheelParams,
     WormParams,
     WormType,
@@ -22,6 +24,12 @@ from .parameters import (
 )
 from .tolerances import get_tolerance
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: pip install -e ".[fast-json]"
+    _json_loads = json.loads
+
 # Directory paths
 CONFIG_DIR = Path(__file__).parent.parent.parent.parent / "config"
 REFERENCE_DIR = Path(__file__).parent.parent.parent.parent / "reference"
@@ -32,8 +40,30 @@ DEFAULT_GEAR_JSON = CONFIG_DIR / "worm_gear.json"
 # Bearing hole clearance (tight fit, can be reamed at assembly if needed)
 BEARING_CLEARANCE = 0.05  # 0.025mm per side
 
+# Shared default params (frozen, so one instance serves every config build)
+_DEFAULT_FRAME = FrameParams()
+_DEFAULT_GEAR = GearParams(worm=WormParams(), wheel=WheelParams())
+
+# Finished configs from create_default_config, most recently used last.
+# Values are (input_files, mtime_stamp, BuildConfig).
+_BUILD_CONFIG_CACHE: OrderedDict = OrderedDict()
+_BUILD_CONFIG_CACHE_SIZE = 64
+
 
-@dataclass
+def _try_load_json(path: Path) -> Optional[dict]:
+    """Load a JSON file, returning None if it does not exist.
+
+    Opening directly (rather than checking exists() first) saves a stat()
+    per lookup on the config search paths. The file is read as bytes in one
+    call and handed straight to the parser, skipping the text-mode wrapper.
+    """
+    try:
+        return _json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class GearConfigPaths:
     """Paths for a gear configuration."""
     json_path: Path              # worm_gear.json
@@ -123,11 +153,8 @@ def load_tuner_config(config_dir: Optional[Path]) -> dict:
     """
     if config_dir is None:
         return {}
-    config_path = config_dir / "tuner_config.json"
-    if config_path.exists():
-        with open(config_path) as f:
-            return json.load(f)
-    return {}
+    tuner_config = _try_load_json(config_dir / "tuner_config.json")
+    return tuner_config if tuner_config is not None else {}
 
 
 def requires_worm_alignment(config: "BuildConfig") -> bool:
@@ -160,38 +187,113 @@ def calculate_worm_z(config: "BuildConfig") -> float:
     3. If worm_z_mode == AUTO: auto-detect based on globoid/virtual_hobbing
     """
     scale = config.scale
-    box_outer = config.frame.box_outer * scale
-    worm_z_mode = config.gear.worm_z_mode
+    frame = config.frame
 
-    # Check explicit overrides first
-    if worm_z_mode == WormZMode.CENTERED:
-        return -box_outer / 2
+    if not _worm_is_aligned(config.gear):
+        # Centered in frame (explicit override, or AUTO with a plain cylindrical worm)
+        return -(frame.box_outer * scale) / 2
 
+    # Aligned: calculate wheel_z (clamped: wheel top at DD top, gap at bottom)
+    post = config.string_post
+    face_width = config.gear.wheel.face_width
+    dd_h = post.get_dd_cut_length(face_width) * scale
+    bearing_h = post.get_bearing_length(frame.wall_thickness) * scale
+    post_z_offset = -(dd_h + bearing_h)
+    return post_z_offset + dd_h - (face_width * scale) / 2
+
+
+def _worm_is_aligned(gear: GearParams) -> bool:
+    """Resolve worm_z_mode to whether the worm axis sits at the wheel center.
+
+    CENTERED and ALIGNED are explicit overrides; AUTO aligns globoid or
+    virtually hobbed worms and centers everything else in the frame.
+    """
+    worm_z_mode = gear.worm_z_mode
+    if worm_z_mode == WormZMode.CENTERED:
+        return False
     if worm_z_mode == WormZMode.ALIGNED:
-        # Calculate wheel_z (clamped: wheel top at DD top, gap at bottom)
-        post_params = config.string_post
-        gear_params = config.gear
-        frame_params = config.frame
-        face_width = gear_params.wheel.face_width
-        dd_h = post_params.get_dd_cut_length(face_width) * scale
-        bearing_h = post_params.get_bearing_length(frame_params.wall_thickness) * scale
-        post_z_offset = -(dd_h + bearing_h)
-        return post_z_offset + dd_h - (face_width * scale) / 2
-
-    # AUTO mode: detect based on worm type and virtual_hobbing
-    if requires_worm_alignment(config):
-        # Aligned: calculate wheel_z (clamped position)
-        post_params = config.string_post
-        gear_params = config.gear
-        frame_params = config.frame
-        face_width = gear_params.wheel.face_width
-        dd_h = post_params.get_dd_cut_length(face_width) * scale
-        bearing_h = post_params.get_bearing_length(frame_params.wall_thickness) * scale
-        post_z_offset = -(dd_h + bearing_h)
-        return post_z_offset + dd_h - (face_width * scale) / 2
+        return True
+    return gear.worm.worm_type == WormType.GLOBOID or gear.virtual_hobbing
+
+
+@lru_cache(maxsize=256)
+def _mesh_z_correction_deg(
+    z_offset: float,
+    lead_angle_deg: float,
+    lead: float,
+    ratio: int,
+) -> float:
+    """Wheel rotation that compensates a worm/wheel Z offset along the helix.
+
+    Pure function of a handful of gear constants, so results are memoized.
+    """
+    effective_axial_shift = z_offset * math.tan(math.radians(lead_angle_deg))
+    return (effective_axial_shift / lead) * 360.0 / ratio
+
+
+@lru_cache(maxsize=128)
+def _derive_bearing_holes(
+    shoulder_diameter: float,
+    shaft_diameter: float,
+    post_bearing_diameter: float,
+    clearance: float,
+) -> tuple[float, float, float]:
+    """Frame hole sizes from the parts that run in them, plus bearing clearance.
+
+    Returns:
+        (worm_entry_hole, peg_bearing_hole, post_bearing_hole)
+    """
+    return (
+        shoulder_diameter + clearance,
+        shaft_diameter + clearance,
+        post_bearing_diameter + clearance,
+    )
+
+
+@lru_cache(maxsize=16)
+def _bore_to_ddcut(bore_diameter: float) -> DDCutParams:
+    """DD cut for a wheel bore: flats ~14% of diameter deep on each side.
+
+    Only a few bore sizes occur across the gear profiles, so results are
+    memoized (DDCutParams is frozen and safe to share).
+    """
+    flat_depth = round(bore_diameter * 0.14, 1)  # ~0.5mm for 3.5mm bore
+    across_flats = round(bore_diameter - 2 * flat_depth, 1)  # ~2.5mm for 3.5mm bore
+    return DDCutParams(
+        diameter=bore_diameter,
+        flat_depth=flat_depth,
+        across_flats=across_flats,
+    )
+
+
+def _mesh_alignment_candidates(
+    module: float, config_dir: Optional[Path]
+) -> list[tuple[Path, bool]]:
+    """Mesh alignment files to try, in priority order.
+
+    Returns:
+        List of (path, nested) where nested marks the geometry_analysis
+        format that wraps the data in a "mesh_alignment" key.
+    """
+    candidates = []
+    if config_dir:
+        # New format: geometry_analysis_m{module}.json with nested mesh_alignment
+        candidates.append((config_dir / f"geometry_analysis_m{module}.json", True))
+        # Old format: mesh_alignment.json at root level
+        candidates.append((config_dir / "mesh_alignment.json", False))
+    # Fall back to reference directory (new format first, then legacy)
+    candidates.append((REFERENCE_DIR / f"geometry_analysis_m{module}.json", True))
+    candidates.append((REFERENCE_DIR / f"mesh_alignment_m{module}.json", False))
+    return candidates
+
 
-    # Default: centered in frame
-    return -box_outer / 2
+def _list_json_names(directory: Path) -> frozenset[str]:
+    """Names of the JSON files in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries if e.name.endswith(".json"))
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
 
 
 def load_mesh_alignment(module: float, config_dir: Optional[Path] = None) -> dict:
@@ -209,39 +311,18 @@ def load_mesh_alignment(module: float, config_dir: Optional[Path] = None) -> dic
     Returns:
         Dict with optimal_rotation_deg, tooth_pitch_deg, etc., or empty dict if not found
     """
-    # Check config directory first
-    if config_dir:
-        # New format: geometry_analysis_m{module}.json with nested mesh_alignment
-        geometry_json = config_dir / f"geometry_analysis_m{module}.json"
-        if geometry_json.exists():
-            with open(geometry_json) as f:
-                data = json.load(f)
-                # New format has mesh_alignment nested
-                if "mesh_alignment" in data:
-                    return data["mesh_alignment"]
-                return data
-
-        # Old format: mesh_alignment.json at root level
-        mesh_json = config_dir / "mesh_alignment.json"
-        if mesh_json.exists():
-            with open(mesh_json) as f:
-                return json.load(f)
-
-    # Fall back to reference directory
-    # Check new format first
-    geometry_json = REFERENCE_DIR / f"geometry_analysis_m{module}.json"
-    if geometry_json.exists():
-        with open(geometry_json) as f:
-            data = json.load(f)
-            if "mesh_alignment" in data:
-                return data["mesh_alignment"]
-            return data
-
-    # Legacy format
-    mesh_json = REFERENCE_DIR / f"mesh_alignment_m{module}.json"
-    if mesh_json.exists():
-        with open(mesh_json) as f:
-            return json.load(f)
+    # One directory listing per directory instead of a failed open per candidate
+    listings: dict[Path, frozenset[str]] = {}
+    for path, nested in _mesh_alignment_candidates(module, config_dir):
+        if path.parent not in listings:
+            listings[path.parent] = _list_json_names(path.parent)
+        if path.name not in listings[path.parent]:
+            continue
+        data = _try_load_json(path)
+        if data is None:
+            continue
+        # New format has mesh_alignment nested
+        return data.get("mesh_alignment", data) if nested else data
     return {}
 
 
@@ -255,8 +336,7 @@ def load_gear_params(json_path: Path, config_dir: Optional[Path] = None) -> Gear
     Returns:
         GearParams populated from JSON
     """
-    with open(json_path) as f:
-        data = json.load(f)
+    data = _json_loads(json_path.read_bytes())
 
     worm_data = data["worm"]
     wheel_data = data["wheel"]
@@ -296,14 +376,7 @@ def load_gear_params(json_path: Path, config_dir: Optional[Path] = None) -> Gear
     # Parse wheel bore (DD cut) - updated for 7.5mm wheel
     wheel_features = features_data.get("wheel", {})
     bore_diameter = wheel_features.get("bore_diameter_mm", 3.5)
-    # Calculate DD parameters: flat_depth ~14% of diameter, across_flats = diameter - 2*flat_depth
-    flat_depth = round(bore_diameter * 0.14, 1)  # ~0.5mm for 3.5mm bore
-    across_flats = round(bore_diameter - 2 * flat_depth, 1)  # ~2.5mm for 3.5mm bore
-    wheel_bore = DDCutParams(
-        diameter=bore_diameter,
-        flat_depth=flat_depth,
-        across_flats=across_flats,
-    )
+    wheel_bore = _bore_to_ddcut(bore_diameter)
 
     # Parse wheel parameters
     wheel = WheelParams(
@@ -350,6 +423,12 @@ def create_default_config(
     - peg_bearing_hole = peg_head.shaft_diameter + BEARING_CLEARANCE
     - post_bearing_hole = string_post.bearing_diameter + BEARING_CLEARANCE
 
+    Results are cached per argument set. A cached config is reused only while
+    the JSON files it was built from (gear, tuner_config and mesh alignment
+    candidates) keep the same modification times. BuildConfig is frozen, so
+    callers share the cached instance and derive variants with
+    dataclasses.replace().
+
     Args:
         scale: Geometry scale factor (1.0 for production, 2.0 for FDM prototype)
         tolerance: Tolerance profile name
@@ -363,6 +442,63 @@ def create_default_config(
     Raises:
         ValueError: If worm tip diameter exceeds entry hole size
     """
+    key = (scale, tolerance, hand, gear_json_path, config_dir)
+    cached = _BUILD_CONFIG_CACHE.get(key)
+    if cached is not None:
+        input_files, stamp, config = cached
+        if _mtime_stamp(input_files) == stamp:
+            _BUILD_CONFIG_CACHE.move_to_end(key)
+            return config
+
+    config = _build_default_config(scale, tolerance, hand, gear_json_path, config_dir)
+
+    input_files = _config_input_files(
+        gear_json_path, config_dir, config.gear.worm.module
+    )
+    _BUILD_CONFIG_CACHE[key] = (input_files, _mtime_stamp(input_files), config)
+    _BUILD_CONFIG_CACHE.move_to_end(key)
+    if len(_BUILD_CONFIG_CACHE) > _BUILD_CONFIG_CACHE_SIZE:
+        _BUILD_CONFIG_CACHE.popitem(last=False)
+    return config
+
+
+def _config_input_files(
+    gear_json_path: Optional[Path],
+    config_dir: Optional[Path],
+    module: float,
+) -> tuple[Path, ...]:
+    """Every file create_default_config may read for these arguments.
+
+    Missing files are included so that creating one (e.g. a new
+    geometry_analysis JSON ahead of the reference fallback) invalidates
+    the cached config.
+    """
+    files = [gear_json_path if gear_json_path is not None else DEFAULT_GEAR_JSON]
+    if config_dir is not None:
+        files.append(config_dir / "tuner_config.json")
+    files.extend(path for path, _ in _mesh_alignment_candidates(module, config_dir))
+    return tuple(files)
+
+
+def _mtime_stamp(paths: tuple[Path, ...]) -> tuple[int, ...]:
+    """Modification times (ns) of paths, 0 for files that do not exist."""
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+def _build_default_config(
+    scale: float,
+    tolerance: str,
+    hand: Hand,
+    gear_json_path: Optional[Path],
+    config_dir: Optional[Path],
+) -> BuildConfig:
+    """Uncached body of create_default_config."""
     tol_config = get_tolerance(tolerance)
 
     # Load gear params from JSON (use default if not specified)
@@ -373,7 +509,7 @@ def create_default_config(
         gear = load_gear_params(gear_json_path, config_dir)
     else:
         # Fallback to hardcoded defaults if JSON not found
-        gear = GearParams(worm=WormParams(), wheel=WheelParams())
+        gear = _DEFAULT_GEAR
 
     # Load tuner config overrides (allows per-gear-config customization)
     tuner_overrides = load_tuner_config(config_dir)
@@ -383,7 +519,7 @@ def create_default_config(
 
     # Create component params first (needed to derive frame hole sizes)
     # Use default wall_thickness from FrameParams for bearing dimensions
-    default_wall = frame_overrides.get("wall_thickness", FrameParams().wall_thickness)
+    default_wall = frame_overrides.get("wall_thickness", _DEFAULT_FRAME.wall_thickness)
 
     # Create StringPostParams
     # Note: bearing_length and dd_cut_length are now DERIVED via methods:
@@ -407,11 +543,14 @@ def create_default_config(
 
     # Derive FrameParams with bearing holes from component dimensions + clearance
     bearing_clearance = frame_overrides.get(
-        "bearing_clearance", FrameParams.bearing_clearance
+        "bearing_clearance", _DEFAULT_FRAME.bearing_clearance
+    )
+    worm_entry_hole, peg_bearing_hole, post_bearing_hole = _derive_bearing_holes(
+        peg_head.shoulder_diameter,
+        peg_head.shaft_diameter,
+        string_post.bearing_diameter,
+        bearing_clearance,
     )
-    worm_entry_hole = peg_head.shoulder_diameter + bearing_clearance
-    peg_bearing_hole = peg_head.shaft_diameter + bearing_clearance
-    post_bearing_hole = string_post.bearing_diameter + bearing_clearance
 
     frame_kwargs = {
         "worm_entry_hole": worm_entry_hole,
@@ -437,55 +576,29 @@ def create_default_config(
     #
     # When worm is centered in frame (cylindrical, no hobbing),
     # we calculate the Z offset and apply helix geometry correction.
-    face_width = gear.wheel.face_width
-    dd_h = string_post.get_dd_cut_length(face_width)
-    bearing_h = string_post.get_bearing_length(frame.wall_thickness)
-    box_outer = frame.box_outer
-    lead = gear.worm.lead
-    ratio = gear.ratio
-    lead_angle_rad = math.radians(gear.worm.lead_angle_deg)
-
-    post_z_offset = -(dd_h + bearing_h)
-    wheel_z = post_z_offset + face_width / 2
-    worm_z_centered = -box_outer / 2
-
-    # Determine if worm will be aligned with wheel or centered
-    # Check mode first, then auto-detect
-    worm_z_mode = gear.worm_z_mode
-    worm_aligned = (
-        worm_z_mode == WormZMode.ALIGNED or
-        (worm_z_mode == WormZMode.AUTO and (
-            gear.worm.worm_type == WormType.GLOBOID or gear.virtual_hobbing
-        ))
-    )
-
-    if worm_aligned:
+    if _worm_is_aligned(gear):
         # Worm and wheel at same Z, no correction needed
         z_offset = 0.0
     else:
         # Worm centered in frame, calculate offset
+        face_width = gear.wheel.face_width
+        dd_h = string_post.get_dd_cut_length(face_width)
+        bearing_h = string_post.get_bearing_length(frame.wall_thickness)
+        post_z_offset = -(dd_h + bearing_h)
+        wheel_z = post_z_offset + face_width / 2
+        worm_z_centered = -frame.box_outer / 2
         z_offset = wheel_z - worm_z_centered
 
     # Convert Z offset to wheel rotation using lead angle geometry
-    effective_axial_shift = z_offset * math.tan(lead_angle_rad)
-    z_correction_deg = (effective_axial_shift / lead) * 360.0 / ratio
+    z_correction_deg = _mesh_z_correction_deg(
+        z_offset, gear.worm.lead_angle_deg, gear.worm.lead, gear.ratio
+    )
 
     # Apply correction to get final mesh rotation
     final_mesh_rotation = gear.mesh_rotation_deg + z_correction_deg
 
     # Create updated gear params with corrected rotation
-    gear = GearParams(
-        worm=gear.worm,
-        wheel=gear.wheel,
-        center_distance=gear.center_distance,
-        pressure_angle_deg=gear.pressure_angle_deg,
-        backlash=gear.backlash,
-        extra_backlash=gear.extra_backlash,
-        ratio=gear.ratio,
-        mesh_rotation_deg=final_mesh_rotation,
-        virtual_hobbing=gear.virtual_hobbing,
-        worm_z_mode=gear.worm_z_mode,
-    )
+    gear = replace(gear, mesh_rotation_deg=final_mesh_rotation)
 
     return BuildConfig(
         scale=scale,
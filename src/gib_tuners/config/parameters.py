@@ -3,38 +3,52 @@
 All dimensions are in millimeters. Parameters are frozen for immutability.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Optional, Tuple
+from functools import lru_cache
 
 
-class Hand(Enum):
+class Hand(str, Enum):
     """Handedness of the tuner assembly."""
     RIGHT = "right"
     LEFT = "left"
 
 
-class WormType(Enum):
+class WormType(str, Enum):
     """Worm geometry type."""
     CYLINDRICAL = "cylindrical"
     GLOBOID = "globoid"
 
 
-class WormZMode(Enum):
+class WormZMode(str, Enum):
     """Worm Z-positioning mode override."""
     AUTO = "auto"        # Auto-detect from worm type and virtual_hobbing
     CENTERED = "centered"  # Force centered in frame (default for cylindrical)
     ALIGNED = "aligned"   # Force aligned with wheel (required for globoid)
 
 
-@dataclass(frozen=True)
+def _cached_hash(self) -> int:
+    """Dataclass field hash, computed once per frozen instance."""
+    h = self._hash
+    if h is None:
+        h = hash(tuple(getattr(self, f.name) for f in fields(self) if f.compare))
+        object.__setattr__(self, "_hash", h)
+    return h
+
+
+def _reduce_without_hash(self):
+    """Pickle via __init__ so a hash salted in another process is never restored."""
+    return (type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init))
+
+
+@dataclass(frozen=True, slots=True)
 class ToleranceConfig:
     """Tolerance adjustments for different manufacturing methods."""
     hole_clearance: float  # Added to nominal hole diameters
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DDCutParams:
     """Double-D cut parameters for anti-rotation interface."""
     diameter: float = 3.5  # Nominal shaft/bore diameter (from worm_gear.json)
@@ -42,7 +56,7 @@ class DDCutParams:
     across_flats: float = 2.5  # Distance between flats (diameter - 2*flat_depth)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EngravingParams:
     """Decorative border engraving on frame top plate."""
     inset: float = 1.0        # Distance from frame edge to outer border line
@@ -53,7 +67,37 @@ class EngravingParams:
     enabled: bool = True       # Toggle engraving on/off
 
 
-@dataclass(frozen=True)
+# Frame layout tuples are rebuilt for every housing during a gang build, but
+# only depend on four scalars, so compute each distinct layout once.
+@lru_cache(maxsize=32)
+def _housing_centers(
+    end_length: float, housing_length: float, tuner_pitch: float, num_housings: int
+) -> tuple[float, ...]:
+    first_center = end_length + housing_length / 2
+    return tuple(first_center + i * tuner_pitch for i in range(num_housings))
+
+
+@lru_cache(maxsize=32)
+def _mounting_hole_positions(
+    end_length: float, housing_length: float, tuner_pitch: float, num_housings: int
+) -> tuple[float, ...]:
+    centers = _housing_centers(end_length, housing_length, tuner_pitch, num_housings)
+    total_length = 2 * end_length + housing_length + (num_housings - 1) * tuner_pitch
+
+    # Hole before first housing (centered in end gap)
+    positions = [end_length / 2]
+
+    # Holes between housings: gap midpoint is the midpoint of adjacent centers
+    # (the half housing lengths either side cancel)
+    positions.extend((a + b) / 2 for a, b in zip(centers, centers[1:]))
+
+    # Hole after last housing (centered in end gap)
+    positions.append(total_length - end_length / 2)
+
+    return tuple(positions)
+
+
+@dataclass(frozen=True, slots=True)
 class FrameParams:
     """Parameters for an N-gang frame (1 to N tuning stations)."""
     # Box section dimensions (measured: 10x10 outer, 7.8x7.8 inner)
@@ -79,7 +123,11 @@ class FrameParams:
     mounting_hole: float = 3.0  # Bottom plate, for headstock bolts
 
     # Decorative engraving
-    engraving: EngravingParams = field(default_factory=EngravingParams)
+    engraving: EngravingParams = EngravingParams()
+
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    __hash__ = _cached_hash
+    __reduce__ = _reduce_without_hash
 
     @property
     def box_inner(self) -> float:
@@ -109,42 +157,29 @@ class FrameParams:
         )
 
     @property
-    def housing_centers(self) -> Tuple[float, ...]:
+    def housing_centers(self) -> tuple[float, ...]:
         """Y positions of housing centers from frame start.
 
         First center = end_length + housing_length / 2 = 10 + 8.1 = 18.1mm
         """
-        first_center = self.end_length + self.housing_length / 2
-        return tuple(first_center + i * self.tuner_pitch for i in range(self.num_housings))
+        return _housing_centers(
+            self.end_length, self.housing_length, self.tuner_pitch, self.num_housings
+        )
 
     @property
-    def mounting_hole_positions(self) -> Tuple[float, ...]:
+    def mounting_hole_positions(self) -> tuple[float, ...]:
         """Y positions of mounting holes from frame start.
 
         Holes are centered in the gaps between housings.
         There are num_housings + 1 holes (one before first, one between each pair,
         one after last).
         """
-        centers = self.housing_centers
-        half_housing = self.housing_length / 2
-        positions = []
-
-        # Hole before first housing (centered in end gap)
-        positions.append(self.end_length / 2)
-
-        # Holes between housings
-        for i in range(len(centers) - 1):
-            gap_start = centers[i] + half_housing
-            gap_end = centers[i + 1] - half_housing
-            positions.append((gap_start + gap_end) / 2)
-
-        # Hole after last housing (centered in end gap)
-        positions.append(self.total_length - self.end_length / 2)
-
-        return tuple(positions)
+        return _mounting_hole_positions(
+            self.end_length, self.housing_length, self.tuner_pitch, self.num_housings
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WormParams:
     """Parameters for the worm (integral to peg head)."""
     # Overridden from config/<profile>/worm_gear.json at load time
@@ -165,7 +200,7 @@ class WormParams:
     throat_curvature_radius: float = 3.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WheelParams:
     """Parameters for the worm wheel."""
     module: float = 0.6
@@ -178,7 +213,7 @@ class WheelParams:
     bore: DDCutParams = DDCutParams()  # 3.5mm DD bore (from worm_gear.json)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GearParams:
     """Combined gear set parameters."""
     # Overridden from config/<profile>/worm_gear.json at load time
@@ -193,8 +228,12 @@ class GearParams:
     virtual_hobbing: bool = False  # If true, auto-aligns worm with wheel center
     worm_z_mode: WormZMode = WormZMode.AUTO  # Override worm Z positioning
 
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    __hash__ = _cached_hash
+    __reduce__ = _reduce_without_hash
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PegHeadParams:
     """Parameters for the peg head assembly (combined from STEP files).
 
@@ -267,6 +306,10 @@ class PegHeadParams:
     washer_id: float = 2.7  # M2.5 washer ID (M2 screw head still captures it)
     washer_thickness: float = 0.5  # M2.5 washer thickness
 
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    __hash__ = _cached_hash
+    __reduce__ = _reduce_without_hash
+
     def get_shaft_length(self, wall_thickness: float) -> float:
         """Total shaft length from shoulder to end.
 
@@ -280,7 +323,7 @@ class PegHeadParams:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StringPostParams:
     """Parameters for the string post (Swiss screw machined).
 
@@ -325,6 +368,10 @@ class StringPostParams:
     string_hole_diameter: float = 1.5
     string_hole_position: float = 2.75  # Centered in visible post (post_height / 2)
 
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    __hash__ = _cached_hash
+    __reduce__ = _reduce_without_hash
+
     def get_bearing_length(self, wall_thickness: float) -> float:
         """Bearing length = wall + axial play.
 
@@ -348,7 +395,7 @@ class StringPostParams:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildConfig:
     """Top-level build configuration."""
     scale: float = 1.0
@@ -364,6 +411,10 @@ class BuildConfig:
     peg_head: PegHeadParams = PegHeadParams()
     string_post: StringPostParams = StringPostParams()
 
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    __hash__ = _cached_hash
+    __reduce__ = _reduce_without_hash
+
     def scaled(self, value: float) -> float:
         """Apply scale factor to a dimension."""
         return value * self.scale
@@ -1,7 +1,7 @@
 """Tolerance profiles for different manufacturing methods."""
 
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
 
 from .parameters import ToleranceConfig
 
@@ -13,8 +13,8 @@ class ToleranceProfile:
     description: str
 
 
-# Pre-defined tolerance profiles from spec Section 1a
-TOLERANCE_PROFILES: Dict[str, ToleranceProfile] = {
+# Pre-defined tolerance profiles from spec Section 1a (read-only view)
+TOLERANCE_PROFILES: MappingProxyType[str, ToleranceProfile] = MappingProxyType({
     "production": ToleranceProfile(
         config=ToleranceConfig(hole_clearance=0.05, name="production"),
         description="Machined brass (final production)",
@@ -27,6 +27,11 @@ TOLERANCE_PROFILES: Dict[str, ToleranceProfile] = {
         config=ToleranceConfig(hole_clearance=0.20, name="prototype_fdm"),
         description="2:1 FDM functional test",
     ),
+})
+
+# Config-only view for get_tolerance (profiles are fixed at import time)
+_TOLERANCE_CONFIGS: dict[str, ToleranceConfig] = {
+    name: profile.config for name, profile in TOLERANCE_PROFILES.items()
 }
 
 
@@ -42,7 +47,8 @@ def get_tolerance(name: str) -> ToleranceConfig:
     Raises:
         KeyError: If profile name not found
     """
-    if name not in TOLERANCE_PROFILES:
-        available = ", ".join(TOLERANCE_PROFILES.keys())
-        raise KeyError(f"Unknown tolerance profile '{name}'. Available: {available}")
-    return TOLERANCE_PROFILES[name].config
+    try:
+        return _TOLERANCE_CONFIGS[name]
+    except KeyError:
+        available = ", ".join(_TOLERANCE_CONFIGS)
+        raise KeyError(f"Unknown tolerance profile '{name}'. Available: {available}") from None
@@ -1,7 +1,7 @@
 """Export utilities for STEP, STL, and engineering drawings."""
 
 from .step_export import export_step, export_assembly_step
-from .stl_export import export_stl
+from .stl_export import export_stl, export_stl_batch
 from .drawing_export import (
     create_drawing,
     create_frame_drawing,
@@ -16,6 +16,7 @@ __all__ = [
     "export_step",
     "export_assembly_step",
     "export_stl",
+    "export_stl_batch",
     "create_drawing",
     "create_frame_drawing",
     "create_string_post_drawing",
@@ -4,6 +4,8 @@ Creates orthographic views with dimensions for manufacturing documentation.
 Uses build123d's native Drawing, DimensionLine/ExtensionLine, and ExportSVG/DXF.
 """
 
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -23,14 +25,14 @@ from build123d import (
 from ..config.parameters import BuildConfig
 
 
-# Standard view directions for orthographic projection
-VIEWS = {
-    "top": {"look_from": (0, 0, 1), "look_up": (0, 1, 0)},      # Plan view (XY plane)
-    "front": {"look_from": (0, -1, 0), "look_up": (0, 0, 1)},   # Front elevation (XZ)
-    "right": {"look_from": (1, 0, 0), "look_up": (0, 0, 1)},    # Right side (YZ)
-    "left": {"look_from": (-1, 0, 0), "look_up": (0, 0, 1)},    # Left side (YZ)
-    "bottom": {"look_from": (0, 0, -1), "look_up": (0, 1, 0)},  # Bottom view
-    "iso": {"look_from": (1, -1, 1), "look_up": (0, 0, 1)},     # Isometric
+# Standard view directions for orthographic projection: (look_from, look_up)
+VIEWS: dict[str, tuple[tuple[int, int, int], tuple[int, int, int]]] = {
+    "top": ((0, 0, 1), (0, 1, 0)),      # Plan view (XY plane)
+    "front": ((0, -1, 0), (0, 0, 1)),   # Front elevation (XZ)
+    "right": ((1, 0, 0), (0, 0, 1)),    # Right side (YZ)
+    "left": ((-1, 0, 0), (0, 0, 1)),    # Left side (YZ)
+    "bottom": ((0, 0, -1), (0, 1, 0)),  # Bottom view
+    "iso": ((1, -1, 1), (0, 0, 1)),     # Isometric
 }
 
 
@@ -48,19 +50,25 @@ def create_drawing(
 
     Returns:
         Drawing object with visible_lines and hidden_lines attributes
+
+    Raises:
+        KeyError: If view is not a name in VIEWS
     """
-    view_config = VIEWS.get(view, VIEWS["iso"])
+    look_from, look_up = VIEWS[view]
     return Drawing(
         part,
-        look_from=view_config["look_from"],
-        look_up=view_config["look_up"],
+        look_from=look_from,
+        look_up=look_up,
         with_hidden=with_hidden,
     )
 
 
+@lru_cache(maxsize=16)
 def create_draft_settings(scale: float = 1.0) -> Draft:
     """Create draft settings scaled for the drawing.
 
+    Memoized per scale; the returned Draft is shared, so treat it as read-only.
+
     Args:
         scale: Drawing scale factor (e.g., 2.0 for 2:1 scale)
 
@@ -126,9 +134,52 @@ def export_drawing_svg(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     exporter.write(str(output_path))
+    _consolidate_svg(output_path)
     return output_path
 
 
+_SVG_NS = "http://www.w3.org/2000/svg"
+
+
+def _consolidate_svg(svg_path: Path) -> None:
+    """Merge each layer's bare strokes into a single multi-subpath <path>.
+
+    ExportSVG writes one <path>/<line> element per edge, each inheriting its
+    stroke style from the layer <g>. Joining them as subpaths of one path
+    renders identically (dash patterns restart per subpath) while shrinking
+    the file and the element count viewers have to parse.
+    """
+    ET.register_namespace("", _SVG_NS)
+    tree = ET.parse(svg_path)
+    path_tag = f"{{{_SVG_NS}}}path"
+    line_tag = f"{{{_SVG_NS}}}line"
+
+    for group in tree.iter(f"{{{_SVG_NS}}}g"):
+        subpaths = []
+        merged = []
+        for child in group:
+            if child.tag == path_tag and child.keys() == ["d"]:
+                subpaths.append(child.get("d"))
+            elif child.tag == line_tag and sorted(child.keys()) == ["x1", "x2", "y1", "y2"]:
+                subpaths.append(
+                    f"M {child.get('x1')},{child.get('y1')} "
+                    f"L {child.get('x2')},{child.get('y2')}"
+                )
+            else:
+                continue
+            merged.append(child)
+        if len(merged) < 2:
+            continue
+        index = list(group).index(merged[0])
+        for child in merged:
+            group.remove(child)
+        combined = ET.Element(path_tag, {"d": " ".join(subpaths)})
+        combined.tail = merged[-1].tail
+        group.insert(index, combined)
+
+    tree.write(svg_path, encoding="utf-8", xml_declaration=True)
+
+
 def export_drawing_dxf(
     drawings: dict[str, Drawing],
     dimensions: list,
@@ -170,6 +221,7 @@ def create_frame_drawing(
     config: BuildConfig,
     output_dir: Path,
     formats: list[str] = ["svg"],
+    with_hidden: bool = False,
 ) -> list[Path]:
     """Create engineering drawing for the frame component.
 
@@ -177,6 +229,7 @@ def create_frame_drawing(
         config: Build configuration with frame parameters
         output_dir: Directory for output files
         formats: List of formats to export ("svg", "dxf")
+        with_hidden: Include hidden (occluded) edges in the projection
 
     Returns:
         List of paths to generated files
@@ -186,14 +239,9 @@ def create_frame_drawing(
     frame = create_frame(config)
     draft = create_draft_settings(scale=2.0)
 
-    # Get frame bounding box for dimension placement
-    bbox = frame.bounding_box()
-
-    # Create views
-    top_view = create_drawing(frame, "top")
-    front_view = create_drawing(frame, "front")
-
-    drawings = {"top": top_view}
+    # Create views (only projected views that are exported - HLR is the
+    # dominant cost of drawing generation)
+    drawings = {"top": create_drawing(frame, "top", with_hidden)}
 
     # Create dimensions based on top view (XY plane projection)
     # Frame is along Y axis, so length is Y extent, width is X extent
@@ -252,6 +300,7 @@ def create_string_post_drawing(
     config: BuildConfig,
     output_dir: Path,
     formats: list[str] = ["svg"],
+    with_hidden: bool = False,
 ) -> list[Path]:
     """Create engineering drawing for the string post component.
 
@@ -259,6 +308,7 @@ def create_string_post_drawing(
         config: Build configuration with string post parameters
         output_dir: Directory for output files
         formats: List of formats to export ("svg", "dxf")
+        with_hidden: Include hidden (occluded) edges in the projection
 
     Returns:
         List of paths to generated files
@@ -269,7 +319,7 @@ def create_string_post_drawing(
     draft = create_draft_settings(scale=5.0)  # Larger scale for small part
 
     # Create views - front shows profile, top shows circular cross-section
-    front_view = create_drawing(post, "front")
+    front_view = create_drawing(post, "front", with_hidden)
 
     drawings = {"front": front_view}
 
@@ -341,6 +391,7 @@ def create_wheel_drawing(
     output_dir: Path,
     wheel_step_path: Optional[Path] = None,
     formats: list[str] = ["svg"],
+    with_hidden: bool = False,
 ) -> list[Path]:
     """Create engineering drawing for the wheel component.
 
@@ -349,6 +400,7 @@ def create_wheel_drawing(
         output_dir: Directory for output files
         wheel_step_path: Path to wheel STEP file (optional)
         formats: List of formats to export ("svg", "dxf")
+        with_hidden: Include hidden (occluded) edges in the projection
 
     Returns:
         List of paths to generated files
@@ -364,11 +416,8 @@ def create_wheel_drawing(
 
     draft = create_draft_settings(scale=5.0)
 
-    # Create views - front shows face, right shows profile
-    front_view = create_drawing(wheel, "front")
-    right_view = create_drawing(wheel, "right")
-
-    drawings = {"front": front_view}
+    # Create views - front shows face
+    drawings = {"front": create_drawing(wheel, "front", with_hidden)}
 
     # Get wheel parameters
     w = config.gear.wheel
@@ -407,6 +456,7 @@ def create_peg_head_drawing(
     output_dir: Path,
     worm_step_path: Optional[Path] = None,
     formats: list[str] = ["svg"],
+    with_hidden: bool = False,
 ) -> list[Path]:
     """Create engineering drawing for the peg head component.
 
@@ -415,6 +465,7 @@ def create_peg_head_drawing(
         output_dir: Directory for output files
         worm_step_path: Path to worm STEP file (optional)
         formats: List of formats to export ("svg", "dxf")
+        with_hidden: Include hidden (occluded) edges in the projection
 
     Returns:
         List of paths to generated files
@@ -434,7 +485,7 @@ def create_peg_head_drawing(
     draft = create_draft_settings(scale=3.0)
 
     # Create views - front shows profile
-    front_view = create_drawing(peg, "front")
+    front_view = create_drawing(peg, "front", with_hidden)
 
     drawings = {"front": front_view}
 
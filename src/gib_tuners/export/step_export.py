@@ -1,7 +1,7 @@
 """STEP file export utilities."""
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from build123d import (
     Compound,
@@ -9,6 +9,8 @@ from build123d import (
     export_step as bd_export_step,
 )
 
+from ..utils.parallel import fork_map
+
 
 def export_step(
     shape: Union[Part, Compound],
@@ -26,42 +28,65 @@ def export_step(
     bd_export_step(shape, str(output_path))
 
 
+def _export_job(job: tuple[Union[Part, Compound], Path]) -> None:
+    shape, path = job
+    bd_export_step(shape, str(path))
+
+
+def _export_steps(
+    jobs: list[tuple[Union[Part, Compound], Path]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Write independent STEP files, in parallel worker processes where possible.
+
+    The caller creates the output directory; paths are written as given.
+    OCCT's STEP writer is CPU-bound and holds the GIL, so files are written by
+    forked processes (see utils.parallel.fork_map, which also decides when to
+    write serially instead).
+    """
+    fork_map(_export_job, jobs, max_workers)
+
+
 def export_assembly_step(
     assembly: dict,
     output_dir: Path,
     prefix: str = "",
+    max_workers: Optional[int] = None,
 ) -> dict[str, Path]:
     """Export an assembly to multiple STEP files.
 
-    Creates one STEP file per component, plus an assembly file.
+    Creates one STEP file per component, plus an assembly file. Files are
+    written in parallel (see _export_steps).
 
     Args:
         assembly: Assembly dictionary from create_gang_assembly
         output_dir: Directory for output files
         prefix: Optional prefix for filenames (e.g., "rh_" or "lh_")
+        max_workers: Worker processes for writing (default: CPU count, 1 = serial)
 
     Returns:
-        Dictionary mapping component names to output paths
+        Dictionary mapping component names (e.g. "tuner_1_wheel") to output paths
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     exported = {}
+    jobs = []
 
     # Export frame
     frame = assembly.get("frame")
     if frame is not None:
         frame_path = output_dir / f"{prefix}frame.step"
-        export_step(frame, frame_path)
+        jobs.append((frame, frame_path))
         exported["frame"] = frame_path
 
     # Export tuner components
     tuners = assembly.get("tuners", [])
     for i, tuner_dict in enumerate(tuners):
-        for name, part in tuner_dict.items():
-            # Extract component type from name (e.g., "tuner_1_string_post" -> "string_post")
-            component_type = name.split("_", 2)[-1] if "_" in name else name
-            component_path = output_dir / f"{prefix}tuner_{i+1}_{component_type}.step"
-            export_step(part, component_path)
-            exported[name] = component_path
+        # Tuner dicts are keyed by component type (e.g. "string_post", "peg_washer")
+        for component_type, part in tuner_dict.items():
+            component_name = f"tuner_{i+1}_{component_type}"
+            component_path = output_dir / f"{prefix}{component_name}.step"
+            jobs.append((part, component_path))
+            exported[component_name] = component_path
 
     # Create full assembly compound and export
     all_parts = [frame] if frame is not None else []
@@ -69,9 +94,11 @@ def export_assembly_step(
         all_parts.extend(tuner_dict.values())
 
     if all_parts:
-        assembly_compound = Compound(all_parts)
+        # A lone part is written as-is rather than wrapped in a new compound
+        assembly_shape = all_parts[0] if len(all_parts) == 1 else Compound(all_parts)
         assembly_path = output_dir / f"{prefix}assembly.step"
-        export_step(assembly_compound, assembly_path)
+        jobs.append((assembly_shape, assembly_path))
         exported["assembly"] = assembly_path
 
+    _export_steps(jobs, max_workers)
     return exported
@@ -1,7 +1,7 @@
 """STL file export utilities."""
 
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Union
 
 from build123d import (
     Compound,
@@ -32,7 +32,11 @@ def export_stl(
     try:
         # Try build123d Mesher first
         mesher = Mesher()
-        mesher.add_shape(shape)
+        mesher.add_shape(
+            shape,
+            linear_deflection=tolerance,
+            angular_deflection=angular_tolerance,
+        )
         mesher.write(str(output_path))
     except Exception:
         # Fall back to OCP direct export (more tolerant of degenerate faces)
@@ -44,3 +48,44 @@ def export_stl(
 
         writer = StlAPI_Writer()
         writer.Write(shape.wrapped, str(output_path))
+
+
+def export_stl_batch(
+    shapes_and_paths: Iterable[tuple[Union[Part, Compound], Path]],
+    tolerance: float = 0.01,
+    angular_tolerance: float = 0.1,
+) -> None:
+    """Export several shapes to their own STL files, meshing them all at once.
+
+    All shapes are triangulated by a single BRepMesh_IncrementalMesh run over
+    a compound of them (parallel across faces). The triangulation is stored
+    on the shared faces, so each per-file StlAPI_Writer call only writes it.
+
+    Args:
+        shapes_and_paths: (shape, output_path) pairs
+        tolerance: Linear tolerance for mesh (mm)
+        angular_tolerance: Angular tolerance for mesh (radians)
+    """
+    from OCP.BRep import BRep_Builder
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+    from OCP.StlAPI import StlAPI_Writer
+    from OCP.TopoDS import TopoDS_Compound
+
+    jobs = list(shapes_and_paths)
+    if not jobs:
+        return
+
+    builder = BRep_Builder()
+    compound = TopoDS_Compound()
+    builder.MakeCompound(compound)
+    for shape, _ in jobs:
+        builder.Add(compound, shape.wrapped)
+
+    mesh = BRepMesh_IncrementalMesh(compound, tolerance, False, angular_tolerance, True)
+    mesh.Perform()
+
+    writer = StlAPI_Writer()
+    writer.ASCIIMode = False  # Binary, matching the Mesher output of export_stl
+    for shape, output_path in jobs:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        writer.Write(shape.wrapped, str(output_path))
@@ -21,6 +21,13 @@ from build123d import (
 from ..config.parameters import BuildConfig, Hand
 
 
+# Rotations (about X, Y, Z in degrees) taking a Z-axis cylinder onto each axis
+_DRILL_ROTATIONS = {
+    Axis.X: (0, 90, 0),
+    Axis.Y: (90, 0, 0),
+}
+
+
 def create_drilling_cylinder(
     diameter: float,
     depth: float,
@@ -44,15 +51,8 @@ def create_drilling_cylinder(
         align=(Align.CENTER, Align.CENTER, Align.CENTER),
     )
 
-    # Rotate to align with axis
-    if axis == Axis.X:
-        cyl = cyl.rotate(Axis.Y, 90)
-    elif axis == Axis.Y:
-        cyl = cyl.rotate(Axis.X, 90)
-    # Z is default, no rotation needed
-
-    cyl = cyl.locate(Location(position))
-    return cyl
+    # Orient and place in one location (no transformed copy of the solid)
+    return cyl.locate(Location(position, _DRILL_ROTATIONS.get(axis, (0, 0, 0))))
 
 
 def calculate_worm_axis_offset(config: BuildConfig) -> float:
@@ -90,13 +90,11 @@ def calculate_hole_positions(
     # Worm axis height (centered in box)
     worm_z = box_outer / 2
 
-    # Determine entry side based on hand
-    if config.hand == Hand.RIGHT:
-        entry_x = -box_outer / 2  # Left side
-        bearing_x = box_outer / 2  # Right side
-    else:
-        entry_x = box_outer / 2  # Right side
-        bearing_x = -box_outer / 2  # Left side
+    # Determine entry side based on hand: RH enters on the left (-X) and
+    # bears on the right (+X), LH is mirrored
+    side = 1 if config.hand == Hand.RIGHT else -1
+    entry_x = -side * box_outer / 2
+    bearing_x = side * box_outer / 2
 
     return {
         "post_top": (0, housing_center_y, box_outer),  # Top of frame
@@ -2,11 +2,12 @@
 
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MeshQuality:
     """Mesh quality metrics."""
     vertices: int
@@ -16,7 +17,7 @@ class MeshQuality:
     volume: float  # mm³
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WallThicknessResult:
     """Result of wall thickness analysis at a specific position."""
     position: float  # mm (along axis)
@@ -26,7 +27,7 @@ class WallThicknessResult:
     region: str  # 'shaft', 'worm', etc.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WallAnalysis:
     """Complete wall thickness analysis results."""
     min_wall: float  # mm
@@ -34,6 +35,20 @@ class WallAnalysis:
     measurements: list[WallThicknessResult]
 
 
+@lru_cache(maxsize=1)
+def _pymeshfix():
+    """Return the optional pymeshfix module, or None if not installed.
+
+    Cached because a failed import is not recorded in sys.modules and
+    would search the import path again on every call.
+    """
+    try:
+        import pymeshfix
+    except ImportError:
+        return None
+    return pymeshfix
+
+
 def load_and_repair_mesh(stl_path: Path) -> "trimesh.Trimesh":
     """Load STL and repair if needed using pymeshfix.
 
@@ -51,13 +66,13 @@ def load_and_repair_mesh(stl_path: Path) -> "trimesh.Trimesh":
         return mesh
 
     # Try pymeshfix repair
+    pymeshfix = _pymeshfix()
+    if pymeshfix is None:
+        return mesh  # pymeshfix not available
     try:
-        import pymeshfix
         mf = pymeshfix.MeshFix(mesh.vertices, mesh.faces)
         mf.repair()
         mesh = trimesh.Trimesh(mf.points, mf.faces)
-    except ImportError:
-        pass  # pymeshfix not available
     except Exception:
         pass  # Repair failed
 
@@ -73,10 +88,10 @@ def check_mesh_quality(mesh: "trimesh.Trimesh") -> MeshQuality:
     Returns:
         MeshQuality dataclass with metrics
     """
-    from collections import Counter
-
-    edge_counts = Counter(tuple(sorted(e)) for e in mesh.edges)
-    nme = sum(1 for c in edge_counts.values() if c != 2)
+    # Each manifold edge is shared by exactly two faces
+    sorted_edges = np.sort(np.asarray(mesh.edges), axis=1)
+    _, counts = np.unique(sorted_edges, axis=0, return_counts=True)
+    nme = int(np.count_nonzero(counts != 2))
 
     return MeshQuality(
         vertices=len(mesh.vertices),
@@ -87,6 +102,43 @@ def check_mesh_quality(mesh: "trimesh.Trimesh") -> MeshQuality:
     )
 
 
+def _radial_distance(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Compute sqrt(x**2 + y**2) in a single output buffer."""
+    r = x * x
+    r += y * y
+    return np.sqrt(r, out=r)
+
+
+def _split_inner_outer(
+    radii: np.ndarray, hole_radius: float
+) -> Optional[tuple[float, float]]:
+    """Separate section radii into hole surface and outer surface.
+
+    Both radii are read straight from one sorted copy: the largest inner
+    radius sits just below the split index and the smallest outer radius
+    at it.
+
+    Args:
+        radii: Radial distances of section points (at least 2)
+        hole_radius: Expected radius of the hole (mm)
+
+    Returns:
+        (inner_radius, outer_radius), or None if no split is found
+    """
+    sorted_r = np.sort(radii)
+
+    # Use first significant gap (> 0.1mm) to separate hole from outer
+    big_gap = np.diff(sorted_r) > 0.1
+    split_idx = int(big_gap.argmax()) + 1
+    if not big_gap[split_idx - 1]:
+        # No clear gap - use threshold
+        split_idx = int(np.searchsorted(sorted_r, hole_radius * 1.5))
+        if split_idx == 0 or split_idx == len(sorted_r):
+            return None
+
+    return sorted_r[split_idx - 1], sorted_r[split_idx]
+
+
 def analyze_axial_wall_thickness(
     mesh: "trimesh.Trimesh",
     axis: int = 0,  # 0=X, 1=Y, 2=Z
@@ -109,8 +161,13 @@ def analyze_axial_wall_thickness(
     Returns:
         WallAnalysis with measurements and minimum wall
     """
+    from trimesh import Trimesh
+    from trimesh.grouping import unique_rows
+    from trimesh.intersections import mesh_multiplane
+
     verts = mesh.vertices
-    axis_vals = verts[:, axis]
+    # Contiguous copy: the column is reduced and (in the fallback) sorted
+    axis_vals = np.ascontiguousarray(verts[:, axis])
 
     # Determine range to analyze
     if axis_range is None:
@@ -129,66 +186,67 @@ def analyze_axial_wall_thickness(
     min_wall = float('inf')
     min_wall_pos = 0.0
 
-    for pos in np.arange(axis_min, axis_max, sample_step):
-        # Try cross-section first for accuracy
-        plane_origin = [0.0, 0.0, 0.0]
-        plane_origin[axis] = pos
-
-        try:
-            section = mesh.section(plane_origin=plane_origin, plane_normal=plane_normal)
-            if section is not None:
-                path_2d, _ = section.to_planar()
-                section_verts = path_2d.vertices
-                radii = np.sqrt(section_verts[:, 0]**2 + section_verts[:, 1]**2)
-            else:
+    positions = np.arange(axis_min, axis_max, sample_step)
+
+    # Only faces spanning part of the sampled range can be cut
+    face_axis = axis_vals[mesh.faces]
+    in_range = (face_axis.max(axis=1) >= axis_min) & (face_axis.min(axis=1) <= axis_max)
+    if in_range.all():
+        slice_mesh = mesh
+    else:
+        slice_mesh = Trimesh(verts, mesh.faces[in_range], process=False)
+
+    # Slice all sample planes in one pass; heights are relative to axis_min
+    plane_origin = [0.0, 0.0, 0.0]
+    plane_origin[axis] = axis_min
+    try:
+        sections, _, _ = mesh_multiplane(
+            slice_mesh,
+            plane_origin=plane_origin,
+            plane_normal=plane_normal,
+            heights=positions - axis_min,
+        )
+    except Exception:
+        sections = None
+        # Vertex-sampling fallback: sort along the axis once so each sample
+        # window is a contiguous slice
+        order = np.argsort(axis_vals)
+        sorted_axis = axis_vals[order]
+        sorted_verts = verts[order]
+        window = sample_step * (1 + 1e-9)
+
+    for i, pos in enumerate(positions):
+        if sections is not None:
+            # Cross-section for accuracy: only the section points are needed,
+            # so skip building Path2D objects from the 2D segments
+            segments = sections[i]
+            if len(segments) == 0:
                 continue
-        except Exception:
+            # Measure radii about the section centroid
+            points = segments.reshape(-1, 2)
+            section_verts = points[unique_rows(points)[0]]
+            section_verts = section_verts - section_verts.mean(axis=0)
+            radii = _radial_distance(section_verts[:, 0], section_verts[:, 1])
+        else:
             # Fall back to vertex sampling
-            mask = np.abs(axis_vals - pos) < sample_step
+            # Widen the window slightly so rounding in pos +/- sample_step
+            # cannot drop a vertex, then apply the exact test to the slice
+            lo, hi = np.searchsorted(sorted_axis, [pos - window, pos + window])
+            mask = np.abs(sorted_axis[lo:hi] - pos) < sample_step
             if mask.sum() < 5:
                 continue
-            slice_verts = verts[mask]
-            radii = np.sqrt(
-                slice_verts[:, radial_axes[0]]**2 +
-                slice_verts[:, radial_axes[1]]**2
+            slice_verts = sorted_verts[lo:hi][mask]
+            radii = _radial_distance(
+                slice_verts[:, radial_axes[0]], slice_verts[:, radial_axes[1]]
             )
 
         if len(radii) < 5:
             continue
 
-        # Separate inner (hole) and outer surfaces
-        sorted_r = np.sort(radii)
-
-        # Find gap between hole and outer surface
-        gaps = np.diff(sorted_r)
-        if len(gaps) == 0:
+        split = _split_inner_outer(radii, hole_radius)
+        if split is None:
             continue
-
-        # Look for significant gap (> 0.1mm) to separate hole from outer
-        big_gap_idx = np.where(gaps > 0.1)[0]
-
-        if len(big_gap_idx) > 0:
-            # Use first big gap to separate inner from outer
-            split_idx = big_gap_idx[0] + 1
-            inner_radii = sorted_r[:split_idx]
-            outer_radii = sorted_r[split_idx:]
-
-            if len(inner_radii) > 0 and len(outer_radii) > 0:
-                inner_r = inner_radii.max()
-                outer_r = outer_radii.min()
-            else:
-                continue
-        else:
-            # No clear gap - use threshold
-            threshold = hole_radius * 1.5
-            inner_mask = radii < threshold
-            outer_mask = radii >= threshold
-
-            if inner_mask.sum() == 0 or outer_mask.sum() == 0:
-                continue
-
-            inner_r = radii[inner_mask].max()
-            outer_r = radii[outer_mask].min()
+        inner_r, outer_r = split
 
         wall = outer_r - inner_r
 
@@ -261,18 +319,21 @@ def analyze_peg_head_tap_hole(
     # Filter measurements: only keep those with hole radius close to expected
     # (within 20% of tap_drill_radius)
     tolerance = tap_drill_radius * 0.25
-    valid_measurements = [
-        m for m in raw_analysis.measurements
-        if abs(m.inner_radius - tap_drill_radius) < tolerance
-    ]
+    raw = raw_analysis.measurements
+    inner_radii = np.fromiter((m.inner_radius for m in raw), dtype=np.float64, count=len(raw))
+    valid_idx = np.flatnonzero(np.abs(inner_radii - tap_drill_radius) < tolerance)
+    valid_measurements = [raw[i] for i in valid_idx]
 
     # Recalculate minimum wall from valid measurements
     if valid_measurements:
-        min_wall = min(m.wall_thickness for m in valid_measurements)
-        min_wall_pos = next(
-            m.position for m in valid_measurements
-            if m.wall_thickness == min_wall
+        walls = np.fromiter(
+            (m.wall_thickness for m in valid_measurements),
+            dtype=np.float64,
+            count=len(valid_measurements),
         )
+        min_m = valid_measurements[int(walls.argmin())]
+        min_wall = min_m.wall_thickness
+        min_wall_pos = min_m.position
     else:
         min_wall = 0.0
         min_wall_pos = 0.0
@@ -343,45 +404,45 @@ def calculate_theoretical_wall(
     Returns:
         WallAnalysis with theoretical measurements
     """
-    measurements = []
-    min_wall = float('inf')
-    min_wall_depth = 0.0
-
     total_shaft = worm_length + bearing_shaft_length
 
-    for depth in np.arange(0, tap_depth + 0.1, 0.25):
-        pos_from_end = total_shaft - depth
-
-        if pos_from_end > worm_length:
-            # In bearing shaft region
-            outer_r = shaft_radius
-            region = "shaft"
-        else:
-            # In worm region - interpolate root radius
-            # Worm center is at worm_length/2
-            dist_from_center = abs(pos_from_end - worm_length / 2)
-            # Linear interpolation from throat to end
-            t = dist_from_center / (worm_length / 2)
-            outer_r = worm_root_at_throat + t * (worm_root_at_end - worm_root_at_throat)
-            region = "worm"
-
-        wall = outer_r - tap_drill_radius
-
-        if wall < min_wall:
-            min_wall = wall
-            min_wall_depth = depth
+    depths = np.arange(0, tap_depth + 0.1, 0.25)
+    pos_from_end = total_shaft - depths
+
+    # Beyond the worm is bearing shaft; within it, interpolate the root radius
+    # linearly from the throat (worm center) to the worm ends
+    in_shaft = pos_from_end > worm_length
+    t = np.abs(pos_from_end - worm_length / 2) / (worm_length / 2)
+    outer_radii = np.where(
+        in_shaft,
+        shaft_radius,
+        worm_root_at_throat + t * (worm_root_at_end - worm_root_at_throat),
+    )
+    walls = outer_radii - tap_drill_radius
 
-        measurements.append(WallThicknessResult(
+    measurements = [
+        WallThicknessResult(
             position=-depth,  # Negative = from shaft end
             inner_radius=tap_drill_radius,
             outer_radius=outer_r,
             wall_thickness=wall,
             region=region,
-        ))
+        )
+        for depth, outer_r, wall, region in zip(
+            depths.tolist(),
+            outer_radii.tolist(),
+            walls.tolist(),
+            np.where(in_shaft, "shaft", "worm").tolist(),
+        )
+    ]
+
+    if not measurements:
+        return WallAnalysis(min_wall=float('inf'), min_wall_position=0.0, measurements=[])
 
+    min_idx = int(np.argmin(walls))
     return WallAnalysis(
-        min_wall=min_wall,
-        min_wall_position=-min_wall_depth,
+        min_wall=float(walls[min_idx]),
+        min_wall_position=-float(depths[min_idx]),
         measurements=measurements,
     )
 
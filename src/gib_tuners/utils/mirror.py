@@ -3,9 +3,10 @@
 The LH variant is a geometric mirror of the RH assembly.
 """
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
-from ..config.parameters import BuildConfig, GearParams, Hand, WormParams
+from ..config.parameters import BuildConfig, Hand
 
 if TYPE_CHECKING:
     from build123d import Compound, Part
@@ -40,37 +41,7 @@ def create_left_hand_config(rh_config: BuildConfig) -> BuildConfig:
     Returns:
         Left-hand build configuration
     """
-    # Create new worm params with left hand
-    lh_worm = WormParams(
-        module=rh_config.gear.worm.module,
-        num_starts=rh_config.gear.worm.num_starts,
-        pitch_diameter=rh_config.gear.worm.pitch_diameter,
-        tip_diameter=rh_config.gear.worm.tip_diameter,
-        root_diameter=rh_config.gear.worm.root_diameter,
-        lead=rh_config.gear.worm.lead,
-        lead_angle_deg=rh_config.gear.worm.lead_angle_deg,
-        length=rh_config.gear.worm.length,
-        hand=Hand.LEFT,
-        throat_reduction=rh_config.gear.worm.throat_reduction,
-        throat_curvature_radius=rh_config.gear.worm.throat_curvature_radius,
-    )
-
-    # Create new gear params with LH worm
-    lh_gear = GearParams(
-        worm=lh_worm,
-        wheel=rh_config.gear.wheel,
-        center_distance=rh_config.gear.center_distance,
-        pressure_angle_deg=rh_config.gear.pressure_angle_deg,
-        backlash=rh_config.gear.backlash,
-        ratio=rh_config.gear.ratio,
-    )
-
-    return BuildConfig(
-        scale=rh_config.scale,
-        tolerance=rh_config.tolerance,
-        hand=Hand.LEFT,
-        frame=rh_config.frame,
-        gear=lh_gear,
-        peg_head=rh_config.peg_head,
-        string_post=rh_config.string_post,
-    )
+    # Copy every other field unchanged (including any added later)
+    lh_worm = replace(rh_config.gear.worm, hand=Hand.LEFT)
+    lh_gear = replace(rh_config.gear, worm=lh_worm)
+    return replace(rh_config, hand=Hand.LEFT, gear=lh_gear)
@@ -0,0 +1,73 @@
+"""Fork-based process pool for CPU-bound OCCT work.
+
+OCCT operations such as STEP writing hold the GIL, so they only run in
+parallel in separate processes. Shapes wrap OCCT objects that cannot be
+pickled, so the jobs reach the workers through fork() rather than pickling:
+only job indices and results cross the process boundary.
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# (func, items) for the current pool, set in each worker by _init_worker.
+# Only ever assigned in worker processes, never in the parent.
+_worker_job: Optional[tuple[Callable, Sequence]] = None
+
+
+def _init_worker(func: Callable, items: Sequence) -> None:
+    # Under fork, initializer arguments are inherited rather than pickled
+    global _worker_job
+    _worker_job = (func, items)
+
+
+def _run_worker_job(index: int):
+    func, items = _worker_job
+    return func(items[index])
+
+
+def fork_map(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: Optional[int] = None,
+) -> list[R]:
+    """Return [func(item) for item in items], in forked worker processes where possible.
+
+    Forking is only done on Linux: elsewhere it is either unavailable
+    (Windows) or unsafe in a process that already runs threads (macOS).
+    Other platforms, a single CPU, or max_workers=1 run serially. Each call
+    has its own pool and keeps no state in the parent, so it is safe to call
+    from several threads or from inside func.
+
+    func must not use OCCT's thread pool (OSD_ThreadPool): its threads do not
+    survive fork(), so a child that waits on them hangs. build123d runs every
+    boolean (&, +, -) on that pool, so func must not run booleans once the
+    parent has. STEP writing does not use the pool.
+
+    Args:
+        func: Function applied to each item; results must be picklable
+        items: Items to process (need not be picklable)
+        max_workers: Worker processes (default: CPU count, 1 = serial)
+
+    Returns:
+        Results in the same order as items. The first worker exception is
+        re-raised.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(items))
+    if max_workers < 2 or not sys.platform.startswith("linux"):
+        return [func(item) for item in items]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(func, items),
+    ) as pool:
+        return list(pool.map(_run_worker_job, range(len(items))))
@@ -0,0 +1,44 @@
+"""Cached STEP import.
+
+Parsing a STEP file is slow (~1s for the wheel), and the same wheel, worm and
+peg head files are imported for every tuner in an assembly. Imports are
+cached per file while its modification time is unchanged.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from build123d import Shape
+
+
+def import_step_cached(step_path: Path) -> Union["Shape", list["Shape"]]:
+    """Import a STEP file, reusing the parsed shapes while the file is unchanged.
+
+    Returns shallow copies: they share the cached geometry but have their own
+    location, so callers may locate() them without affecting later imports.
+
+    Args:
+        step_path: Path to the STEP file
+
+    Returns:
+        Whatever build123d's import_step returns (a shape or list of shapes)
+
+    Raises:
+        FileNotFoundError: If the STEP file doesn't exist
+    """
+    mtime_ns = Path(step_path).stat().st_mtime_ns
+    shapes = _import_step(str(step_path), mtime_ns)
+    if isinstance(shapes, list):
+        return [copy.copy(shape) for shape in shapes]
+    return copy.copy(shapes)
+
+
+@lru_cache(maxsize=16)
+def _import_step(step_path: str, mtime_ns: int):
+    """Uncached body of import_step_cached, keyed on the file's mtime."""
+    from build123d import import_step
+
+    return import_step(step_path)
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import os
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -9,9 +10,13 @@ import pytest
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from gib_tuners.assembly.gang_assembly import create_positioned_assembly
 from gib_tuners.config.defaults import create_default_config, load_gear_params, resolve_gear_config
 from gib_tuners.config.parameters import BuildConfig, Hand
 
+# Paths and configs are immutable (frozen dataclasses), so they are built
+# once per session and shared across tests.
+
 
 def pytest_addoption(parser):
     """Add --gear command line option to pytest."""
@@ -23,43 +28,43 @@ def pytest_addoption(parser):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gear_profile(request) -> str:
     """Return the gear profile name from command line or environment."""
     return request.config.getoption("--gear")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gear_paths(gear_profile):
     """Return gear config paths for the selected profile."""
     return resolve_gear_config(gear_profile)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gear_json_path(gear_paths) -> Path:
     """Return path to gear JSON file."""
     return gear_paths.json_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_dir(gear_paths) -> Path:
     """Return path to gear config directory."""
     return gear_paths.config_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def reference_dir(project_root: Path) -> Path:
     """Return path to reference files directory."""
     return project_root / "reference"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_config(gear_paths) -> BuildConfig:
     """Create a default build configuration using selected gear profile."""
     return create_default_config(
@@ -68,7 +73,7 @@ def default_config(gear_paths) -> BuildConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def production_config(gear_paths) -> BuildConfig:
     """Create a production build configuration using selected gear profile."""
     return create_default_config(
@@ -80,7 +85,17 @@ def production_config(gear_paths) -> BuildConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def gear_config(gear_json_path) -> BuildConfig:
+    """Create a production configuration from the gear JSON alone.
+
+    Unlike production_config, no config_dir is passed, so tuner_config.json
+    overrides and mesh alignment for the profile are not applied.
+    """
+    return create_default_config(gear_json_path=gear_json_path)
+
+
+@pytest.fixture(scope="session")
 def prototype_config(gear_paths) -> BuildConfig:
     """Create a 2x prototype configuration using selected gear profile."""
     return create_default_config(
@@ -90,3 +105,22 @@ def prototype_config(gear_paths) -> BuildConfig:
         gear_json_path=gear_paths.json_path,
         config_dir=gear_paths.config_dir,
     )
+
+
+@pytest.fixture(scope="session")
+def assembled(gear_paths, default_config):
+    """Build a 1-gang assembly with hardware once per session (expensive).
+
+    Returns (assembly, config). Built with check_interference=False; tests
+    that need the report run run_interference_report() on it. Shared across
+    modules, so tests must not modify the returned assembly.
+    """
+    config = replace(default_config, frame=replace(default_config.frame, num_housings=1))
+
+    assembly = create_positioned_assembly(
+        config,
+        wheel_step_path=gear_paths.wheel_step,
+        worm_step_path=gear_paths.worm_step,
+        include_hardware=True,
+    )
+    return assembly, config
@@ -8,6 +8,8 @@ import pytest
 from gib_tuners.config.defaults import create_default_config, resolve_gear_config
 from gib_tuners.assembly import (
     AssemblyInterferenceError,
+    check_interference,
+    check_interference_pairs,
     create_positioned_assembly,
     run_interference_report,
 )
@@ -16,30 +18,20 @@ from gib_tuners.assembly import (
 class TestAssemblyInterference:
     """Tests for assembly interference checking.
 
-    Uses gear_paths fixture from conftest.py (parameterized via --gear option).
+    Uses the gear_paths and session-scoped assembled fixtures from conftest.py
+    (parameterized via --gear option).
     """
 
-    def test_single_housing_no_interference(self, gear_paths):
+    def test_single_housing_no_interference(self, assembled):
         """Test that a single-housing assembly has no interference."""
-        config = create_default_config(
-            gear_json_path=gear_paths.json_path,
-            config_dir=gear_paths.config_dir,
-        )
-        config = replace(config, frame=replace(config.frame, num_housings=1))
+        assembly, _config = assembled
 
-        # Should not raise
-        assembly = create_positioned_assembly(
-            config,
-            wheel_step_path=gear_paths.wheel_step,
-            worm_step_path=gear_paths.worm_step,
-            check_interference=True,
-        )
+        results = run_interference_report(assembly, verbose=False)
 
-        # Verify interference results are included
-        assert "interference" in assembly
-        # Small interference expected from gear mesh (zero backlash)
-        assert assembly["interference"]["total"] < 0.1
+        # Within the check_interference=True threshold (0.03 mm³ per housing)
+        assert results["total"] < 0.03
 
+    @pytest.mark.slow
     def test_five_housing_no_interference(self, gear_paths):
         """Test that a 5-housing assembly has no interference."""
         config = create_default_config(
@@ -58,20 +50,9 @@ class TestAssemblyInterference:
         # 5 housings with small gear mesh interference each
         assert assembly["interference"]["total"] < 0.5
 
-    def test_interference_report_keys(self, gear_paths):
+    def test_interference_report_keys(self, assembled):
         """Test that interference report contains expected keys."""
-        config = create_default_config(
-            gear_json_path=gear_paths.json_path,
-            config_dir=gear_paths.config_dir,
-        )
-        config = replace(config, frame=replace(config.frame, num_housings=1))
-
-        assembly = create_positioned_assembly(
-            config,
-            wheel_step_path=gear_paths.wheel_step,
-            worm_step_path=gear_paths.worm_step,
-            check_interference=False,  # Don't raise, just build
-        )
+        assembly, _config = assembled
 
         results = run_interference_report(assembly, verbose=False)
 
@@ -82,20 +63,57 @@ class TestAssemblyInterference:
         assert "tuner_1_worm_in_hole" in results
         assert "tuner_1_wheel_in_cavity" in results
 
-    def test_check_interference_false_no_validation(self, gear_paths):
-        """Test that check_interference=False skips validation."""
-        config = create_default_config(
-            gear_json_path=gear_paths.json_path,
-            config_dir=gear_paths.config_dir,
-        )
-        config = replace(config, frame=replace(config.frame, num_housings=1))
+    @pytest.mark.parametrize("total, raises", [(0.02, False), (0.04, True)])
+    def test_check_interference_threshold(self, monkeypatch, default_config, total, raises):
+        """Test that check_interference=True raises at 0.03 mm³ per housing.
 
-        assembly = create_positioned_assembly(
-            config,
-            wheel_step_path=gear_paths.wheel_step,
-            worm_step_path=gear_paths.worm_step,
-            check_interference=False,
+        The report is stubbed and the STEP files left out (placeholder wheel),
+        so this checks the threshold wiring without the gear-mesh booleans.
+        """
+        from gib_tuners.assembly import gang_assembly
+
+        report = {"tuner_1_gear_mesh": total, "total": total}
+        monkeypatch.setattr(
+            gang_assembly, "run_interference_report", lambda assembly, verbose: report
         )
+        config = replace(default_config, frame=replace(default_config.frame, num_housings=1))
+
+        if raises:
+            with pytest.raises(AssemblyInterferenceError) as excinfo:
+                create_positioned_assembly(
+                    config, include_hardware=False, check_interference=True
+                )
+            assert excinfo.value.results is report
+            assert "tuner_1_gear_mesh" in str(excinfo.value)
+        else:
+            assembly = create_positioned_assembly(
+                config, include_hardware=False, check_interference=True
+            )
+            assert assembly["interference"] is report
+
+    def test_check_interference_false_no_validation(self, assembled):
+        """Test that check_interference=False skips validation."""
+        # The shared assembly is built with check_interference=False
+        assembly, _config = assembled
 
         # Should not have interference key when not checked
         assert "interference" not in assembly
+
+
+class TestCheckInterferencePairs:
+    """Tests for batched pairwise interference checks."""
+
+    def test_matches_check_interference(self):
+        """Test that batched results match check_interference, in order."""
+        from build123d import Box, Pos
+
+        a = Box(2, 2, 2)
+        pairs = [
+            (a, Pos(1, 0, 0) * Box(2, 2, 2)),  # Half overlap: 4 mm³
+            (a, Pos(5, 0, 0) * Box(2, 2, 2)),  # Disjoint
+        ]
+        expected = [check_interference(part_a, part_b) for part_a, part_b in pairs]
+
+        assert expected[0] == pytest.approx(4.0)
+        assert expected[1] == 0.0
+        assert check_interference_pairs(pairs) == expected
@@ -0,0 +1,21 @@
+"""Tests for the fork-based worker pool."""
+
+from gib_tuners.utils.parallel import fork_map
+
+
+class TestForkMap:
+    """Tests for the fork-based worker pool."""
+
+    def test_unpicklable_items_keep_order(self):
+        """Test that items reach workers without pickling and results stay in order."""
+        items = [lambda n=n: n * n for n in range(6)]  # Lambdas cannot be pickled
+
+        assert fork_map(lambda item: item(), items, max_workers=1) == [0, 1, 4, 9, 16, 25]
+        assert fork_map(lambda item: item(), items, max_workers=3) == [0, 1, 4, 9, 16, 25]
+
+    def test_nested_calls(self):
+        """Test that a call from inside a worker does not disturb the outer pool."""
+        def inner(n):
+            return sum(fork_map(lambda m: m + n, [1, 2], max_workers=2))
+
+        assert fork_map(inner, [10, 20], max_workers=2) == [23, 43]
@@ -1,5 +1,10 @@
 """Tests for parameter dataclasses."""
 
+import os
+import pickle
+import shutil
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pathlib import Path
 
@@ -14,9 +19,15 @@ from gib_tuners.config.parameters import (
     ToleranceConfig,
     WheelParams,
     WormParams,
+    WormType,
 )
 from gib_tuners.config.tolerances import TOLERANCE_PROFILES, get_tolerance
-from gib_tuners.config.defaults import create_default_config, load_gear_params
+from gib_tuners.config.defaults import (
+    create_default_config,
+    load_gear_params,
+    load_mesh_alignment,
+    load_tuner_config,
+)
 
 
 class TestFrameParams:
@@ -44,12 +55,8 @@ class TestFrameParams:
         params = FrameParams()
         centers = params.housing_centers
         assert len(centers) == 5
-        # Symmetric positions: 18.1, 45.3, 72.5, 99.7, 126.9
-        assert abs(centers[0] - 18.1) < 0.01
-        assert abs(centers[1] - 45.3) < 0.01
-        assert abs(centers[2] - 72.5) < 0.01  # Frame center
-        assert abs(centers[3] - 99.7) < 0.01
-        assert abs(centers[4] - 126.9) < 0.01
+        # Symmetric positions; 72.5 is the frame center
+        assert centers == pytest.approx((18.1, 45.3, 72.5, 99.7, 126.9), abs=0.01)
         # Verify symmetry: first and last are equidistant from ends
         end1 = centers[0] - params.housing_length / 2
         end2 = params.total_length - (centers[-1] + params.housing_length / 2)
@@ -62,8 +69,7 @@ class TestFrameParams:
         assert len(positions) == 6
         # Symmetric end holes: 5.0 and 140.0
         expected = (5.0, 31.7, 58.9, 86.1, 113.3, 140.0)
-        for actual, exp in zip(positions, expected):
-            assert abs(actual - exp) < 0.01
+        assert positions == pytest.approx(expected, abs=0.01)
 
     def test_frozen(self):
         """Test that params are immutable."""
@@ -107,6 +113,11 @@ class TestToleranceProfiles:
         with pytest.raises(KeyError):
             get_tolerance("invalid")
 
+    def test_profiles_read_only(self):
+        """Test that the shared profile table cannot be modified."""
+        with pytest.raises(TypeError):
+            TOLERANCE_PROFILES["custom"] = TOLERANCE_PROFILES["production"]
+
 
 class TestBuildConfig:
     """Tests for build configuration."""
@@ -129,6 +140,37 @@ class TestBuildConfig:
         )
         assert config.with_tolerance(4.0) == 4.1
 
+    def test_hash_cached_and_not_pickled(self):
+        """Test that the cached hash is stable, value-based and not pickled."""
+        config = BuildConfig(scale=2.0)
+        assert hash(config) == hash(config) == hash(BuildConfig(scale=2.0))
+        assert config == BuildConfig(scale=2.0)
+
+        restored = pickle.loads(pickle.dumps(config))
+        assert restored == config
+        assert restored._hash is None
+        assert hash(restored) == hash(config)
+
+    def test_left_hand_config_keeps_other_fields(self):
+        """Test that the LH config changes only the hand settings."""
+        from gib_tuners.utils.mirror import create_left_hand_config
+
+        worm = WormParams(worm_type=WormType.GLOBOID, relief_groove_radius=0.3)
+        rh = BuildConfig(
+            scale=2.0,
+            gear=GearParams(worm=worm, wheel=WheelParams(), extra_backlash=0.1),
+        )
+        lh = create_left_hand_config(rh)
+
+        assert lh.hand == Hand.LEFT
+        assert lh.gear.worm.hand == Hand.LEFT
+        assert lh.gear.worm.worm_type == WormType.GLOBOID
+        assert lh.gear.worm.relief_groove_radius == 0.3
+        assert lh.gear.extra_backlash == 0.1
+        assert lh.gear.wheel is rh.gear.wheel
+        assert lh.frame is rh.frame
+        assert lh.scale == 2.0
+
 
 class TestLoadGearParams:
     """Tests for loading gear parameters from JSON."""
@@ -138,9 +180,6 @@ class TestLoadGearParams:
 
         Actual values come from worm_gear.json which is the source of truth.
         """
-        if not gear_json_path.exists():
-            pytest.skip("Gear JSON file not found")
-
         gear = load_gear_params(gear_json_path)
 
         # Check worm params - verify structure and reasonable ranges
@@ -166,31 +205,92 @@ class TestLoadGearParams:
 class TestDerivedParameters:
     """Tests for parameters derived from gear config."""
 
-    def test_dd_cut_length_shorter_than_wheel(self, gear_json_path):
+    def test_dd_cut_length_shorter_than_wheel(self, gear_config):
         """Test that dd_cut_length is wheel.face_width minus clearance."""
-        if not gear_json_path.exists():
-            pytest.skip("Gear JSON file not found")
-
-        config = create_default_config(gear_json_path=gear_json_path)
+        config = gear_config
         wheel_face_width = config.gear.wheel.face_width
         dd_cut_length = config.string_post.get_dd_cut_length(wheel_face_width)
         clearance = config.string_post.dd_cut_clearance
         assert dd_cut_length == wheel_face_width - clearance
         assert clearance == 0.5  # Bottom gap for compression clamping
 
-    def test_worm_entry_hole_derived_from_shoulder_diameter(self, gear_json_path):
+    def test_worm_entry_hole_derived_from_shoulder_diameter(self, gear_config):
         """Test that worm_entry_hole is derived from peg shoulder diameter."""
-        if not gear_json_path.exists():
-            pytest.skip("Gear JSON file not found")
-
-        config = create_default_config(gear_json_path=gear_json_path)
+        config = gear_config
         expected = config.peg_head.shoulder_diameter + 0.05  # BEARING_CLEARANCE
         assert config.frame.worm_entry_hole == expected
 
-    def test_worm_fits_through_entry_hole(self, gear_json_path):
+    def test_worm_fits_through_entry_hole(self, gear_config):
         """Test that worm tip diameter is less than entry hole."""
-        if not gear_json_path.exists():
-            pytest.skip("Gear JSON file not found")
-
-        config = create_default_config(gear_json_path=gear_json_path)
+        config = gear_config
         assert config.gear.worm.tip_diameter < config.frame.worm_entry_hole
+
+
+class TestConfigLoaders:
+    """Tests for the optional JSON config loaders."""
+
+    def test_tuner_config_missing(self, tmp_path):
+        """Test that a config dir without tuner_config.json gives no overrides."""
+        assert load_tuner_config(tmp_path) == {}
+        assert load_tuner_config(None) == {}
+
+    def test_tuner_config_present(self, tmp_path):
+        """Test that tuner_config.json overrides are returned as-is."""
+        (tmp_path / "tuner_config.json").write_text('{"peg_head": {"shaft_diameter": 4.5}}')
+        assert load_tuner_config(tmp_path) == {"peg_head": {"shaft_diameter": 4.5}}
+
+    def test_mesh_alignment_nested(self, tmp_path):
+        """Test that the nested mesh_alignment block is extracted from geometry analysis."""
+        (tmp_path / "geometry_analysis_m0.5.json").write_text(
+            '{"design_info": {}, "mesh_alignment": {"optimal_rotation_deg": 15.0}}'
+        )
+        assert load_mesh_alignment(0.5, tmp_path) == {"optimal_rotation_deg": 15.0}
+
+    def test_mesh_alignment_old_format(self, tmp_path):
+        """Test that the old flat mesh_alignment.json format is still read."""
+        (tmp_path / "mesh_alignment.json").write_text('{"optimal_rotation_deg": 3.0}')
+        assert load_mesh_alignment(0.7, tmp_path) == {"optimal_rotation_deg": 3.0}
+
+    def test_mesh_alignment_missing(self, tmp_path):
+        """Test that a module with no alignment data anywhere gives an empty dict."""
+        assert load_mesh_alignment(0.9, tmp_path) == {}
+
+
+class TestConfigCache:
+    """Tests for create_default_config result caching."""
+
+    def test_repeat_call_returns_cached_config(self, gear_paths):
+        """Test that identical arguments return the same frozen instance."""
+        kwargs = dict(gear_json_path=gear_paths.json_path, config_dir=gear_paths.config_dir)
+        assert create_default_config(**kwargs) is create_default_config(**kwargs)
+        assert create_default_config(scale=2.0, **kwargs) is not create_default_config(**kwargs)
+
+    def test_cache_invalidated_by_modified_input(self, gear_paths, tmp_path):
+        """Test that editing tuner_config.json produces a fresh config."""
+        shutil.copy(gear_paths.json_path, tmp_path / "worm_gear.json")
+        tuner_config = tmp_path / "tuner_config.json"
+        tuner_config.write_text('{"peg_head": {"shaft_diameter": 4.5}}')
+        kwargs = dict(gear_json_path=tmp_path / "worm_gear.json", config_dir=tmp_path)
+
+        first = create_default_config(**kwargs)
+        assert first.peg_head.shaft_diameter == 4.5
+
+        tuner_config.write_text('{"peg_head": {"shaft_diameter": 4.4}}')
+        mtime = tuner_config.stat().st_mtime_ns + 1_000_000_000
+        os.utime(tuner_config, ns=(mtime, mtime))
+
+        second = create_default_config(**kwargs)
+        assert second is not first
+        assert second.peg_head.shaft_diameter == 4.4
+
+    def test_cached_config_rejects_mutation(self, gear_paths):
+        """Test that shared cached configs cannot be modified by callers."""
+        config = create_default_config(
+            gear_json_path=gear_paths.json_path, config_dir=gear_paths.config_dir
+        )
+        with pytest.raises(FrozenInstanceError):
+            config.scale = 2.0
+        with pytest.raises(FrozenInstanceError):
+            config.gear.mesh_rotation_deg = 0.0
+        with pytest.raises(FrozenInstanceError):
+            config.gear.wheel.bore.flat_depth = 0.0
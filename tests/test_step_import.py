@@ -0,0 +1,27 @@
+"""Tests for cached STEP imports."""
+
+from pathlib import Path
+
+import pytest
+
+from gib_tuners.utils.step_import import import_step_cached
+
+
+class TestStepImportCache:
+    """Tests for cached STEP imports."""
+
+    def test_cached_import_returns_independent_copies(self, reference_dir: Path):
+        """Test that moving one import does not move later ones."""
+        from build123d import Location
+
+        step_path = reference_dir / "wheel_m0.5_z13.step"
+        if not step_path.exists():
+            pytest.skip("STEP files not available")
+
+        first = import_step_cached(step_path)
+        min_x = first.bounding_box().min.X
+        first.locate(Location((10, 0, 0)))
+
+        second = import_step_cached(step_path)
+        assert second is not first
+        assert second.bounding_box().min.X == pytest.approx(min_x)
@@ -1,27 +1,36 @@
 """Tests for geometry validation (spec Section 9)."""
 
+import os
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
 from gib_tuners.config.defaults import create_default_config
 from gib_tuners.utils.validation import (
+    check_mesh_quality,
+    check_shape_quality,
     validate_geometry,
+    ValidationCheck,
     ValidationResult,
     check_wheel_worm_interference,
     find_optimal_mesh_rotation,
 )
 
+_REFERENCE_DIR = Path(__file__).parent.parent / "reference"
+_STEP_FILES_AVAILABLE = all(
+    (_REFERENCE_DIR / name).exists()
+    for name in ("wheel_m0.5_z13.step", "worm_m0.5_z1.step")
+)
+
 
 class TestSpecValidation:
     """Tests that validate the design against spec Section 9."""
 
     @pytest.fixture
-    def config(self, gear_json_path):
-        """Create a production configuration."""
-        if gear_json_path.exists():
-            return create_default_config(gear_json_path=gear_json_path)
-        return create_default_config()
+    def config(self, gear_config):
+        """Production configuration shared across the session."""
+        return gear_config
 
     def test_all_validations_pass(self, config):
         """Test that all spec validations pass with default params."""
@@ -138,6 +147,21 @@ class TestValidationOutput:
         assert "Validation" in output
         assert "PASSED" in output or "FAILED" in output
 
+    def test_failed_result_lists_only_failures(self):
+        """Test that a failed result reports failing checks only."""
+        result = ValidationResult(
+            passed=False,
+            checks=[
+                ValidationCheck("Fits", True, "> 0", "1.00mm", ""),
+                ValidationCheck("Too big", False, "> 0", "-1.00mm", ""),
+            ],
+        )
+        output = str(result)
+        assert output.startswith("Validation FAILED")
+        assert "[ ] Too big" in output
+        assert "Actual: -1.00mm" in output
+        assert "Fits" not in output
+
     def test_validation_checks_count(self):
         """Test that validation has expected number of checks."""
         config = create_default_config()
@@ -145,19 +169,87 @@ class TestValidationOutput:
         # Should have at least 10 checks
         assert len(result.checks) >= 10
 
+    def test_fail_fast_stops_at_first_failure(self):
+        """Test that fail_fast returns as soon as a check fails."""
+        config = create_default_config()
+        config = replace(config, frame=replace(config.frame, worm_entry_hole=1.0))
 
-class TestWheelWormInterference:
-    """Tests for wheel-worm mesh interference checking."""
+        full = validate_geometry(config)
+        fast = validate_geometry(config, fail_fast=True)
 
-    @pytest.fixture
-    def wheel_step_path(self, reference_dir: Path) -> Path:
-        """Return path to wheel STEP file."""
-        return reference_dir / "wheel_m0.5_z13.step"
+        assert not full.passed
+        assert not fast.passed
+        assert len(fast.checks) < len(full.checks)
+        assert not fast.checks[-1].passed
+        assert all(check.passed for check in fast.checks[:-1])
+
+
+class TestTrustedQualityChecks:
+    """Tests for skipping shape/mesh quality checks on trusted geometry."""
+
+    def test_trusted_shape_skips_analysis(self):
+        """Test that a trusted shape is reported valid without being analyzed."""
+        result = check_shape_quality(None, trusted=True)
+        assert result.is_valid
+        assert result.issues == []
+
+    def test_env_var_trusts_mesh(self, monkeypatch, tmp_path):
+        """Test that GIB_TRUST_SHAPES=1 skips loading the mesh."""
+        monkeypatch.setenv("GIB_TRUST_SHAPES", "1")
+        result = check_mesh_quality(tmp_path / "missing.stl")
+        assert result.is_watertight
+        assert result.non_manifold_edges == 0
+
+
+class TestMeshQualityCache:
+    """Tests for check_mesh_quality result caching."""
+
+    def test_cached_until_file_changes(self, tmp_path):
+        """Test that an unchanged STL reuses its result and an edited one does not."""
+        trimesh = pytest.importorskip("trimesh")
+        stl_path = tmp_path / "part.stl"
+        trimesh.creation.box().export(stl_path)
+
+        first = check_mesh_quality(stl_path)
+        assert first.is_watertight
+        assert check_mesh_quality(stl_path) is first
+
+        trimesh.creation.icosphere().export(stl_path)
+        mtime = stl_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(stl_path, ns=(mtime, mtime))
+
+        second = check_mesh_quality(stl_path)
+        assert second is not first
+        assert second.is_watertight
+
+
+@pytest.fixture(scope="module")
+def wheel_step_path(reference_dir: Path) -> Path:
+    """Return path to wheel STEP file."""
+    return reference_dir / "wheel_m0.5_z13.step"
+
+
+@pytest.fixture(scope="module")
+def worm_step_path(reference_dir: Path) -> Path:
+    """Return path to worm STEP file."""
+    return reference_dir / "worm_m0.5_z1.step"
+
+
+@pytest.fixture(scope="module")
+def optimal_mesh_rotation(wheel_step_path, worm_step_path, production_config):
+    """Run the mesh rotation sweep once for the tests that inspect its result.
+
+    Returns (rotation, result) from find_optimal_mesh_rotation.
+    """
+    return find_optimal_mesh_rotation(
+        wheel_step_path=wheel_step_path,
+        worm_step_path=worm_step_path,
+        config=production_config,
+    )
 
-    @pytest.fixture
-    def worm_step_path(self, reference_dir: Path) -> Path:
-        """Return path to worm STEP file."""
-        return reference_dir / "worm_m0.5_z1.step"
+
+class TestWheelWormInterference:
+    """Tests for wheel-worm mesh interference checking."""
 
     def test_interference_check_with_missing_files(self, production_config):
         """Test that interference check handles missing files gracefully."""
@@ -169,17 +261,12 @@ class TestWheelWormInterference:
         assert not result.within_backlash_tolerance
         assert "Could not load" in result.message
 
-    @pytest.mark.skipif(
-        not Path(__file__).parent.parent.joinpath("reference/wheel_m0.5_z13.step").exists(),
-        reason="STEP files not available"
-    )
+    @pytest.mark.slow
+    @pytest.mark.skipif(not _STEP_FILES_AVAILABLE, reason="STEP files not available")
     def test_interference_check_loads_step_files(
         self, wheel_step_path, worm_step_path, production_config
     ):
         """Test that interference check can load STEP files."""
-        if not wheel_step_path.exists() or not worm_step_path.exists():
-            pytest.skip("STEP files not available")
-
         result = check_wheel_worm_interference(
             wheel_step_path=wheel_step_path,
             worm_step_path=worm_step_path,
@@ -188,23 +275,14 @@ class TestWheelWormInterference:
         # Should not contain "Could not load" error
         assert "Could not load" not in result.message
 
-    @pytest.mark.skipif(
-        not Path(__file__).parent.parent.joinpath("reference/wheel_m0.5_z13.step").exists(),
-        reason="STEP files not available"
-    )
+    @pytest.mark.slow
+    @pytest.mark.skipif(not _STEP_FILES_AVAILABLE, reason="STEP files not available")
     def test_optimal_mesh_rotation_is_deterministic(
-        self, wheel_step_path, worm_step_path, production_config
+        self, optimal_mesh_rotation, wheel_step_path, worm_step_path, production_config
     ):
         """Test that mesh rotation calculation gives same result each run."""
-        if not wheel_step_path.exists() or not worm_step_path.exists():
-            pytest.skip("STEP files not available")
-
-        # Run calculation twice
-        rotation1, _ = find_optimal_mesh_rotation(
-            wheel_step_path=wheel_step_path,
-            worm_step_path=worm_step_path,
-            config=production_config,
-        )
+        # Compare the shared run against a fresh one
+        rotation1, _ = optimal_mesh_rotation
         rotation2, _ = find_optimal_mesh_rotation(
             wheel_step_path=wheel_step_path,
             worm_step_path=worm_step_path,
@@ -215,22 +293,13 @@ class TestWheelWormInterference:
             f"Mesh rotation not deterministic: {rotation1}° vs {rotation2}°"
         )
 
-    @pytest.mark.skipif(
-        not Path(__file__).parent.parent.joinpath("reference/wheel_m0.5_z13.step").exists(),
-        reason="STEP files not available"
-    )
+    @pytest.mark.slow
+    @pytest.mark.skipif(not _STEP_FILES_AVAILABLE, reason="STEP files not available")
     def test_optimal_rotation_within_tooth_pitch(
-        self, wheel_step_path, worm_step_path, production_config
+        self, optimal_mesh_rotation, production_config
     ):
         """Test that optimal rotation is within one tooth pitch angle."""
-        if not wheel_step_path.exists() or not worm_step_path.exists():
-            pytest.skip("STEP files not available")
-
-        rotation, _ = find_optimal_mesh_rotation(
-            wheel_step_path=wheel_step_path,
-            worm_step_path=worm_step_path,
-            config=production_config,
-        )
+        rotation, _ = optimal_mesh_rotation
         num_teeth = production_config.gear.wheel.num_teeth
         tooth_angle = 360.0 / num_teeth  # ~27.69° for 13 teeth
 
@@ -238,22 +307,11 @@ class TestWheelWormInterference:
             f"Rotation {rotation}° should be in [0, {tooth_angle}°)"
         )
 
-    @pytest.mark.skipif(
-        not Path(__file__).parent.parent.joinpath("reference/wheel_m0.5_z13.step").exists(),
-        reason="STEP files not available"
-    )
-    def test_interference_within_tolerance(
-        self, wheel_step_path, worm_step_path, production_config
-    ):
+    @pytest.mark.slow
+    @pytest.mark.skipif(not _STEP_FILES_AVAILABLE, reason="STEP files not available")
+    def test_interference_within_tolerance(self, optimal_mesh_rotation):
         """Test that optimized mesh has interference within tolerance."""
-        if not wheel_step_path.exists() or not worm_step_path.exists():
-            pytest.skip("STEP files not available")
-
-        rotation, result = find_optimal_mesh_rotation(
-            wheel_step_path=wheel_step_path,
-            worm_step_path=worm_step_path,
-            config=production_config,
-        )
+        rotation, result = optimal_mesh_rotation
         # At minimum, should be within manufacturing tolerance
         assert result.within_manufacturing_tolerance, (
             f"Interference {result.interference_volume_mm3:.4f}mm³ exceeds tolerance. "